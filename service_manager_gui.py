@@ -13,20 +13,257 @@ import subprocess
 import json
 import os
 import sys
+import re
+import shutil
+import signal
+import selectors
+import socket
 import requests
 import psutil
-from datetime import datetime
 import queue
+from collections import Counter, deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import NamedTuple
 from ports_config import get_backend_port, get_frontend_port, get_backend_url, get_frontend_url, ports_config
 
 
+# 配置诊断用的正则：vite.config.ts中的端口、package.json中electron:dev的wait-on地址
+_VITE_PORT_RE = re.compile(r'port:\s*(\d+)')
+_WAIT_ON_RE = re.compile(r'wait-on http://localhost:(\d+)')
+
+# Vite输出中 "Local: http://localhost:端口" 的端口
+_LOCALHOST_PORT_RE = re.compile(r'localhost:(\d+)')
+
+# 日志级别；显示时每条日志额外带 "lvl-级别" 标签，级别过滤通过该标签的elide属性隐藏/显示
+_LOG_LEVELS = ("INFO", "WARN", "ERROR")
+# 各级别插入时使用的片段：(时间戳标签, 级别文本, 级别标签, 消息标签)
+_LOG_SEGMENT_TAGS = {
+    level: (("timestamp", f"lvl-{level}"), f"[{level}] ", (level, f"lvl-{level}"), f"lvl-{level}")
+    for level in _LOG_LEVELS
+}
+
+
+class LogEntry(NamedTuple):
+    """一条日志记录，按字段保存，显示或复制时再拼成文本"""
+    timestamp: str
+    level: str
+    message: str
+    
+    def __str__(self):
+        return f"[{self.timestamp}] [{self.level}] {self.message}\n"
+
+# 格式 -> (整秒时间, 格式化结果)
+_TIMESTAMP_CACHE = {}
+
+
+def _cached_timestamp(fmt):
+    """返回当前时间的格式化字符串，同一秒内复用上次的结果"""
+    now = int(time.time())
+    cached = _TIMESTAMP_CACHE.get(fmt)
+    if cached and cached[0] == now:
+        return cached[1]
+    text = time.strftime(fmt, time.localtime(now))
+    _TIMESTAMP_CACHE[fmt] = (now, text)
+    return text
+
+
+# Tk 8.6的Text把BMP以外的字符(部分emoji)计为两个索引位置
+_TK_WIDE_CHARS = tk.TkVersion < 9.0
+
+
+def _tk_len(text):
+    """返回文本在Tk Text索引中占用的字符数"""
+    if _TK_WIDE_CHARS and not text.isascii():
+        return len(text) + sum(1 for ch in text if ord(ch) > 0xFFFF)
+    return len(text)
+
+
+# 子进程输出每次读取的块大小
+_PIPE_CHUNK_SIZE = 4096
+
+# Windows下启动子进程时不弹出控制台窗口
+_NO_WINDOW_FLAGS = subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+
+# 后端Python子进程的输出环境：输出到管道时不做块缓冲，统一按UTF-8编码，
+# 日志即时送达且读取端只需按块解码一次
+_BACKEND_ENV = {**os.environ, "PYTHONUNBUFFERED": "1", "PYTHONIOENCODING": "utf-8"}
+
+
+def _resolve_executable(name):
+    """解析命令的可执行文件路径，Windows下优先使用.cmd包装脚本"""
+    if os.name == 'nt':
+        return shutil.which(f"{name}.cmd") or shutil.which(name)
+    return shutil.which(name)
+
+
+# 后端(uvicorn/loguru)日志级别标记，按顺序匹配，"| WARN"同时覆盖WARNING
+_BACKEND_LEVEL_TAGS = (
+    ("| INFO ", "INFO"),
+    ("| ERROR ", "ERROR"),
+    ("| WARN", "WARN"),
+)
+
+# loguru格式 "时间 | 级别 | ..." 中第一个分隔符后5个字符对应的级别，用于快速判断
+_BACKEND_LEVEL_PREFIXES = {
+    "INFO ": "INFO",
+    "ERROR": "ERROR",
+    "WARN ": "WARN",
+    "WARNI": "WARN",
+}
+# 界面没有对应过滤级别的调试日志，读取时直接丢弃
+_BACKEND_SKIPPED_LEVELS = frozenset(("DEBUG", "TRACE"))
+
+
+def _classify_backend_level(line):
+    """根据后端日志行中的级别标记返回日志级别，未识别时视为ERROR，调试日志返回None"""
+    # 快速路径：只看第一个 "| " 后的级别字段，格式不符时再逐个查找标记
+    idx = line.find("| ")
+    if idx >= 0:
+        field = line[idx + 2:idx + 7]
+        level = _BACKEND_LEVEL_PREFIXES.get(field)
+        if level:
+            return level
+        if field in _BACKEND_SKIPPED_LEVELS:
+            return None
+    for tag, level in _BACKEND_LEVEL_TAGS:
+        if line.find(tag) >= 0:
+            return level
+    return "ERROR"
+
+
+def _iter_pipe_batches(pipe, chunk_size=_PIPE_CHUNK_SIZE):
+    """按块读取子进程管道，每次产出本次读到的完整行(解码后的文本列表)
+
+    使用os.read批量读取，避免readline每行一次系统调用；
+    不完整的尾行保留在缓冲区中等待下一次读取。
+    """
+    fd = pipe.fileno()
+    buffer = bytearray()
+    while True:
+        try:
+            chunk = os.read(fd, chunk_size)
+        except OSError:
+            break
+        if not chunk:
+            break
+        buffer.extend(chunk)
+        end = buffer.rfind(b'\n')
+        if end < 0:
+            continue
+        complete = bytes(buffer[:end])
+        del buffer[:end + 1]
+        yield complete.decode('utf-8', errors='replace').split('\n')
+    if buffer:
+        yield [buffer.decode('utf-8', errors='replace')]
+
+
+class _PipeReader:
+    """用一个线程通过selectors同时读取多个子进程管道(仅POSIX，Windows的管道不支持select)
+
+    每个管道按块读取并切分成行，每块的所有行一次传给回调，回调在读取线程中执行。
+    """
+    
+    def __init__(self):
+        self._selector = selectors.DefaultSelector()
+        self._lock = threading.Lock()
+        self._thread = None
+    
+    def watch(self, pipe, callback):
+        """注册管道，返回读到EOF或被移除时置位的Event"""
+        done = threading.Event()
+        with self._lock:
+            self._selector.register(pipe.fileno(), selectors.EVENT_READ, (callback, bytearray(), done))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        return done
+    
+    def discard(self, pipe):
+        """在关闭管道前移除注册"""
+        with self._lock:
+            try:
+                key = self._selector.unregister(pipe.fileno())
+            except (KeyError, ValueError):
+                return
+        key.data[2].set()
+    
+    def _run(self):
+        while True:
+            for key, _ in self._selector.select(timeout=0.5):
+                callback, buffer, done = key.data
+                with self._lock:
+                    # 期间可能已被discard，fd甚至已被新管道复用
+                    if self._selector.get_map().get(key.fd) is not key:
+                        continue
+                    try:
+                        chunk = os.read(key.fd, _PIPE_CHUNK_SIZE)
+                    except OSError:
+                        chunk = b''
+                    if not chunk:
+                        self._selector.unregister(key.fd)
+                
+                if chunk:
+                    buffer.extend(chunk)
+                    end = buffer.rfind(b'\n')
+                    if end < 0:
+                        continue
+                    complete = bytes(buffer[:end])
+                    del buffer[:end + 1]
+                    lines = complete.decode('utf-8', errors='replace').split('\n')
+                else:
+                    lines = [buffer.decode('utf-8', errors='replace')] if buffer else []
+                    buffer.clear()
+                
+                if lines:
+                    try:
+                        callback(lines)
+                    except Exception as e:
+                        print(f"管道输出处理错误: {e}")
+                if not chunk:
+                    done.set()
+
+
 class ServiceManagerGUI:
+    # Vite在端口被占用时会依次尝试的端口范围
+    _VITE_PORTS = frozenset(range(5173, 5181))
+    
+    # 每类日志在内存中保留的条目数
+    _LOG_HISTORY_SIZE = 500
+    
+    # 日志队列的轮询间隔(毫秒)和每次刷新最多取出的队列项数；队列空闲时放慢轮询
+    _LOG_DRAIN_MS = 50
+    _LOG_DRAIN_IDLE_MS = 250
+    _LOG_BATCH_SIZE = 200
+    
+    # 日志组件保留的行数；超过阈值时一次性裁剪，避免每条日志都删除一行
+    _LOG_DISPLAY_LINES = 200
+    _LOG_TRIM_THRESHOLD = 250
+    
+    # 搜索输入防抖延迟和日志统计刷新间隔(毫秒)
+    _SEARCH_DEBOUNCE_MS = 200
+    _STATS_REFRESH_MS = 200
+    
+    # 服务状态检查间隔(秒)：状态不变时逐步放宽，有变化时恢复
+    _STATUS_POLL_MIN = 2.0
+    _STATUS_POLL_MAX = 30.0
+    
+    # 端口监控轮询间隔(秒)：无变化时逐步放宽，有变化时恢复
+    _PORT_POLL_MIN = 2.0
+    _PORT_POLL_MAX = 30.0
+    
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("量化回测系统 - 服务管理器")
         self.root.geometry("1000x700")
         self.root.resizable(True, True)
         
+        # 服务目录在启动时解析为绝对路径，之后不受工作目录变化影响
+        self.backend_path = os.path.abspath("backend")
+        self.frontend_path = os.path.abspath("frontend")
+        self._verified_dirs = set()  # 已确认存在的目录，不再重复检查
+        
         # 后端服务状态
         self.backend_pid = None
         self.backend_port = get_backend_port()
@@ -41,22 +278,61 @@ class ServiceManagerGUI:
         self.vite_pid = None  # Vite开发服务器PID
         self.electron_pid = None  # Electron应用PID
         
+        # 本地服务的HTTP检查共用一个会话，复用keep-alive连接
+        self._http = requests.Session()
+        # 前端状态检查在此线程中执行，与后端检查并行
+        self._probe_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="status-probe")
+        
+        # 服务进程的psutil.Process对象缓存，状态检查和启动检查共用
+        self._service_procs = {}
+        
+        # 子进程输出监控(线程或管道读完时置位的Event)，停止服务时回收
+        self._backend_monitors = []
+        self._frontend_monitors = []
+        self._vite_monitors = []
+        self._electron_monitors = []
+        # POSIX下所有子进程管道共用一个selectors读取线程
+        self._pipe_reader = _PipeReader() if os.name != 'nt' else None
+        # 停止服务后等待输出读完并关闭管道，在此线程中执行，不阻塞界面
+        self._release_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pipe-release")
+        
         # 配置诊断结果
         self.config_issues = []
         
         # 端口占用监控
         self.port_occupation_data = {}
         self.port_monitoring_enabled = True
+        self._proc_name_cache = {}  # pid -> (进程名, 创建时间)
+        self._last_port_lines = []  # 端口文本框中已显示的 (行文本, 标签)
+        self._port_wake_event = threading.Event()  # 用于立即唤醒端口监控线程
+        self._status_wake_event = threading.Event()  # 用于立即唤醒状态检查线程
+        # 跟踪窗口可见性：最小化时暂停端口扫描和日志刷新，恢复时唤醒
+        self._window_visible = True
+        self._log_view_stale = False  # 隐藏期间有日志未写入显示
+        self.root.bind('<Map>', self._on_root_map, add='+')
+        self.root.bind('<Unmap>', self._on_root_unmap, add='+')
         
         # 日志队列和存储
-        self.log_queue = queue.Queue()
-        self.backend_logs = []
-        self.frontend_logs = []
-        self.system_logs = []
+        # 有界队列：界面来不及刷新时丢弃最旧的待显示日志，日志本身仍保存在内存存储中
+        self.log_queue = queue.Queue(maxsize=2000)
+        # 环形缓冲，超出容量时自动丢弃最旧的
+        self.backend_logs = deque(maxlen=self._LOG_HISTORY_SIZE)
+        self.frontend_logs = deque(maxlen=self._LOG_HISTORY_SIZE)
+        self.system_logs = deque(maxlen=self._LOG_HISTORY_SIZE)
+        # 各标签按级别的日志计数，随写入和淘汰增量维护
+        self.log_level_counts = {"system": Counter(), "backend": Counter(), "frontend": Counter()}
+        self._log_store_lock = threading.Lock()  # 监控线程与界面线程都会写入日志存储
         self.current_log_tab = "system"  # system, backend, frontend
+        self._log_line_count = 0  # 日志文本组件中的行数，避免向Tk查询
+        self._log_view_size = self._LOG_DISPLAY_LINES  # 日志组件当前展开的条目数，向上翻到顶部时扩大
+        self._log_page_pending = False  # 已安排加载更早的日志
+        self._log_view_epoch = 0  # 日志显示整体重绘的次数，用于丢弃重绘前已入队的日志
+        self._search_timer = None  # 待执行的搜索高亮任务
+        self._stats_timer = None  # 待执行的日志统计刷新任务
+        self._highlighted_search = ""  # 最近一次高亮的搜索词
         
-        # 执行配置诊断
-        self.diagnose_configuration()
+        # 配置诊断需要读文件和探测端口，放到后台执行，不阻塞窗口显示
+        threading.Thread(target=self._async_diagnose, daemon=True).start()
         
         # 创建界面
         self.create_widgets()
@@ -65,167 +341,219 @@ class ServiceManagerGUI:
         self.status_thread = threading.Thread(target=self.status_update_loop, daemon=True)
         self.status_thread.start()
         
-        # 启动日志处理线程
-        self.log_thread = threading.Thread(target=self.log_process_loop, daemon=True)
-        self.log_thread.start()
+        # 在界面线程中定时批量取出日志队列
+        self.root.after(self._LOG_DRAIN_MS, self._drain_log_queue)
         
         # 启动端口监控线程
         self.port_monitor_thread = threading.Thread(target=self.port_monitoring_loop, daemon=True)
         self.port_monitor_thread.start()
     
     def diagnose_configuration(self):
-        """配置诊断功能 - 检查端口配置一致性"""
-        self.config_issues = []
+        """配置诊断功能 - 检查端口配置一致性
+        
+        结果先收集到局部列表，完成后一次性替换，后台线程执行时界面不会读到半成品。
+        """
+        issues = []
         
         try:
             # 检查前端vite.config.ts中的端口配置
-            vite_config_path = os.path.join(os.getcwd(), "frontend", "vite.config.ts")
+            vite_config_path = os.path.join(self.frontend_path, "vite.config.ts")
             if os.path.exists(vite_config_path):
                 with open(vite_config_path, 'r', encoding='utf-8') as f:
                     content = f.read()
                     # 查找port配置
-                    import re
-                    port_match = re.search(r'port:\s*(\d+)', content)
+                    port_match = _VITE_PORT_RE.search(content)
                     if port_match:
                         vite_port = int(port_match.group(1))
                         if vite_port != self.frontend_port:
-                            self.config_issues.append({
+                            issues.append({
                                 'type': 'error',
                                 'message': f'端口配置不一致！Python配置前端端口为{self.frontend_port}，但vite.config.ts中配置为{vite_port}'
                             })
                     
                     # 检查strictPort配置
                     if 'strictPort: true' not in content:
-                        self.config_issues.append({
+                        issues.append({
                             'type': 'warning', 
                             'message': 'vite.config.ts中缺少strictPort: true配置，可能导致端口漂移'
                         })
         except Exception as e:
-            self.config_issues.append({
+            issues.append({
                 'type': 'warning',
                 'message': f'无法检查vite.config.ts: {str(e)}'
             })
         
         try:
             # 检查package.json中electron:dev的wait-on配置
-            package_json_path = os.path.join(os.getcwd(), "frontend", "package.json")
+            package_json_path = os.path.join(self.frontend_path, "package.json")
             if os.path.exists(package_json_path):
                 with open(package_json_path, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                     electron_dev = data.get('scripts', {}).get('electron:dev', '')
                     if 'wait-on http://localhost:' in electron_dev:
                         # 提取wait-on的端口
-                        import re
-                        wait_on_match = re.search(r'wait-on http://localhost:(\d+)', electron_dev)
+                        wait_on_match = _WAIT_ON_RE.search(electron_dev)
                         if wait_on_match:
                             wait_on_port = int(wait_on_match.group(1))
                             if wait_on_port != self.frontend_port:
-                                self.config_issues.append({
+                                issues.append({
                                     'type': 'error',
                                     'message': f'Electron等待端口不一致！期望{self.frontend_port}，但package.json中wait-on配置为{wait_on_port}'
                                 })
         except Exception as e:
-            self.config_issues.append({
+            issues.append({
                 'type': 'warning',
                 'message': f'无法检查package.json: {str(e)}'
             })
         
         # 检查端口可用性
         if not self.is_port_available(self.backend_port):
-            self.config_issues.append({
+            issues.append({
                 'type': 'warning',
                 'message': f'后端端口{self.backend_port}已被占用'
             })
             
         if not self.is_port_available(self.frontend_port):
-            self.config_issues.append({
+            issues.append({
                 'type': 'warning', 
                 'message': f'前端端口{self.frontend_port}已被占用'
             })
+        
+        self.config_issues = issues
     
     def is_port_available(self, port):
-        """检查端口是否可用"""
-        import socket
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.settimeout(1)
-                result = s.connect_ex(('127.0.0.1', port))
-                return result != 0
-        except:
-            return False
+        """检查端口是否可用 - 尝试绑定端口，不需要建立TCP连接"""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            # POSIX下忽略TIME_WAIT残留；Windows的SO_REUSEADDR允许抢占已监听端口，不能使用
+            if os.name != 'nt':
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            s.setblocking(False)
+            try:
+                s.bind(('127.0.0.1', port))
+                return True
+            except OSError:
+                return False
     
     def scan_port_occupation(self):
         """扫描端口占用情况"""
-        import subprocess
-        import re
-        
         port_data = {}
-        important_ports = [self.backend_port, self.frontend_port, 5173, 5174, 5175, 5176, 5177, 5178, 5179, 5180]
+        important_ports = self._VITE_PORTS | {self.backend_port, self.frontend_port}
+        system_ports = (self.backend_port, self.frontend_port)
         
         try:
-            # Windows 命令获取端口占用信息
-            result = subprocess.run('netstat -ano', shell=True, capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                
-                for line in lines:
-                    if 'LISTENING' in line:
-                        parts = line.split()
-                        if len(parts) >= 5:
-                            try:
-                                address = parts[1]
-                                pid = parts[4]
-                                
-                                # 提取端口号
-                                if ':' in address:
-                                    port_str = address.split(':')[-1]
-                                    if port_str.isdigit():
-                                        port = int(port_str)
-                                        
-                                        # 只关注重要端口
-                                        if port in important_ports:
-                                            # 获取进程信息
-                                            process_name = self.get_process_name(pid)
-                                            port_data[port] = {
-                                                'pid': pid,
-                                                'process_name': process_name,
-                                                'address': address,
-                                                'is_system_service': port in [self.backend_port, self.frontend_port]
-                                            }
-                            except (ValueError, IndexError):
-                                continue
+            # 直接读取系统套接字表，只关注处于监听状态的重要端口
+            listeners = [
+                conn for conn in psutil.net_connections(kind='inet')
+                if conn.status == psutil.CONN_LISTEN and conn.laddr
+                and conn.laddr.port in important_ports
+            ]
+            self._prefetch_process_names(conn.pid for conn in listeners if conn.pid)
+            
+            for conn in listeners:
+                port = conn.laddr.port
+                pid = conn.pid
+                port_data[port] = {
+                    'pid': pid,
+                    'process_name': self.get_process_name(pid) if pid else "未知进程",
+                    'address': f"{conn.laddr.ip}:{port}",
+                    'is_system_service': port in system_ports
+                }
         except Exception as e:
             self.add_log(f"端口扫描失败: {e}", "ERROR")
         
         return port_data
     
+    def _prefetch_process_names(self, pids):
+        """更新本次扫描到的PID的进程名缓存
+        
+        未出现在本次扫描中的PID直接移除；已缓存的只核对创建时间(排除PID被复用)，
+        缺少的一次遍历进程表批量获取，新取得的条目带有当时的创建时间，无需再核对。
+        """
+        pids = set(pids)
+        cache = self._proc_name_cache
+        for pid in list(cache.keys() - pids):
+            cache.pop(pid, None)
+        for pid in list(pids & cache.keys()):
+            try:
+                if psutil.Process(pid).create_time() != cache[pid][1]:
+                    cache.pop(pid, None)
+            except (psutil.Error, KeyError):
+                cache.pop(pid, None)
+        
+        missing = pids - cache.keys()
+        if not missing:
+            return
+        for process in psutil.process_iter(['pid', 'name', 'create_time']):
+            info = process.info
+            if info['pid'] in missing and info['name'] and info['create_time']:
+                self._proc_name_cache[info['pid']] = (info['name'], info['create_time'])
+    
     def get_process_name(self, pid):
-        """根据PID获取进程名"""
+        """根据PID获取进程名，结果按PID缓存"""
         try:
-            process = psutil.Process(int(pid))
-            return process.name()
-        except (psutil.NoSuchProcess, ValueError):
+            pid = int(pid)
+            cached = self._proc_name_cache.get(pid)
+            if cached:
+                return cached[0]
+            process = psutil.Process(pid)
+            with process.oneshot():
+                name = process.name()
+                create_time = process.create_time()
+            self._proc_name_cache[pid] = (name, create_time)
+            return name
+        except (psutil.NoSuchProcess, psutil.AccessDenied, ValueError):
             return "未知进程"
     
     def port_monitoring_loop(self):
         """端口监控循环"""
+        interval = self._PORT_POLL_MIN
         while True:
             try:
+                # 窗口最小化时暂停扫描，直到窗口恢复或手动刷新
+                if not self._window_visible:
+                    self._port_wake_event.wait()
+                    self._port_wake_event.clear()
+                    interval = self._PORT_POLL_MIN
+                
                 if self.port_monitoring_enabled:
                     new_data = self.scan_port_occupation()
                     if new_data != self.port_occupation_data:
                         self.port_occupation_data = new_data
                         self.root.after(0, self._update_port_display)
-                time.sleep(5)  # 每5秒检查一次
+                        interval = self._PORT_POLL_MIN
+                    else:
+                        interval = min(interval * 1.5, self._PORT_POLL_MAX)
+                
+                # 等待下一次检查，被唤醒时恢复最短间隔
+                if self._port_wake_event.wait(interval):
+                    self._port_wake_event.clear()
+                    interval = self._PORT_POLL_MIN
             except Exception as e:
                 print(f"端口监控错误: {e}")
                 time.sleep(10)
     
+    def _on_root_map(self, event):
+        """主窗口或日志区域重新显示(子组件的Map事件也会经过主窗口的绑定)"""
+        if event.widget is self.root:
+            self._window_visible = True
+            self._port_wake_event.set()
+        elif event.widget is not getattr(self, 'log_text', None):
+            return
+        # 补上隐藏期间积累的日志
+        if self._log_view_stale and self.log_text.winfo_viewable():
+            self._log_view_stale = False
+            self._refresh_filtered_logs()
+            self._update_log_stats()
+    
+    def _on_root_unmap(self, event):
+        """主窗口被最小化或隐藏"""
+        if event.widget is self.root:
+            self._window_visible = False
+    
     def _update_port_display(self):
-        """更新端口显示"""
+        """更新端口显示 - 只重写与上次内容不同的行"""
         if hasattr(self, 'port_text'):
-            self.port_text.config(state=tk.NORMAL)
-            self.port_text.delete("1.0", tk.END)
+            lines = []
             
             # 显示重要端口状态
             important_ports = [self.backend_port, self.frontend_port, 5173, 5174, 5175, 5176]
@@ -236,42 +564,53 @@ class ServiceManagerGUI:
                     pid = data['pid']
                     process_name = data['process_name']
                     
-                    # 检查是否是我们的系统服务
-                    is_our_service = (
-                        (port == self.backend_port and pid == str(self.backend_pid)) or
-                        (port == self.frontend_port and pid == str(self.vite_pid))
-                    )
-                    
-                    if is_our_service:
-                        status_line = f"端口 {port}: ✅ {process_name} (PID: {pid}) [系统服务]\n"
-                        self.port_text.insert(tk.END, status_line, "system")
+                    if self._is_our_service(port, pid):
+                        lines.append((f"端口 {port}: ✅ {process_name} (PID: {pid}) [系统服务]\n", "system"))
                     else:
-                        status_line = f"端口 {port}: ⚠️ {process_name} (PID: {pid}) [外部进程]\n"
-                        self.port_text.insert(tk.END, status_line, "occupied")
+                        lines.append((f"端口 {port}: ⚠️ {process_name} (PID: {pid}) [外部进程]\n", "occupied"))
                 else:
-                    status_line = f"端口 {port}: 🔓 可用\n"
-                    self.port_text.insert(tk.END, status_line, "available")
+                    lines.append((f"端口 {port}: 🔓 可用\n", "available"))
             
             # 添加统计信息
             occupied_count = len([p for p in important_ports if p in self.port_occupation_data])
             available_count = len(important_ports) - occupied_count
             
-            self.port_text.insert(tk.END, f"\n📊 统计: {occupied_count}个已占用, {available_count}个可用\n", "info")
+            lines.append(("\n", "info"))
+            lines.append((f"📊 统计: {occupied_count}个已占用, {available_count}个可用\n", "info"))
             
             # 添加更新时间
-            from datetime import datetime
-            update_time = datetime.now().strftime("%H:%M:%S")
-            self.port_text.insert(tk.END, f"🕐 更新时间: {update_time}\n", "info")
+            update_time = _cached_timestamp("%H:%M:%S")
+            lines.append((f"🕐 更新时间: {update_time}\n", "info"))
             
+            old_lines = self._last_port_lines
+            changed = [i for i, line in enumerate(lines)
+                       if i >= len(old_lines) or old_lines[i] != line]
+            
+            self.port_text.config(state=tk.NORMAL)
+            if len(changed) * 2 > len(lines):
+                # 大部分行变化(如首次显示)：整体重写，文本与标签交替传参，一次insert完成
+                self.port_text.delete("1.0", tk.END)
+                self.port_text.insert(tk.END, *(part for line in lines for part in line))
+            else:
+                # 逐行对比，只删除/插入发生变化的行
+                for i in changed:
+                    text, tag = lines[i]
+                    if i < len(old_lines):
+                        self.port_text.delete(f"{i + 1}.0", f"{i + 2}.0")
+                    self.port_text.insert(f"{i + 1}.0", text, tag)
+                if len(old_lines) > len(lines):
+                    self.port_text.delete(f"{len(lines) + 1}.0", tk.END)
             self.port_text.config(state=tk.DISABLED)
+            self._last_port_lines = lines
     
     def kill_specific_process(self, pid):
         """终止指定进程"""
         try:
-            import os
             if os.name == 'nt':  # Windows
-                result = subprocess.run(f'taskkill /PID {pid} /F', 
-                                      shell=True, capture_output=True, text=True)
+                # 直接传参数列表，不经过cmd.exe，也不弹出控制台窗口
+                result = subprocess.run(['taskkill', '/PID', str(pid), '/F'],
+                                        capture_output=True, text=True,
+                                        creationflags=_NO_WINDOW_FLAGS)
                 if result.returncode == 0:
                     self.add_log(f"已终止进程 PID: {pid}", "INFO")
                     return True
@@ -279,7 +618,7 @@ class ServiceManagerGUI:
                     self.add_log(f"终止进程失败 PID: {pid} - {result.stderr}", "ERROR")
                     return False
             else:  # Unix/Linux
-                os.system(f'kill -9 {pid}')
+                os.kill(int(pid), signal.SIGKILL)
                 self.add_log(f"已终止进程 PID: {pid}", "INFO")
                 return True
         except Exception as e:
@@ -289,6 +628,7 @@ class ServiceManagerGUI:
     def manual_port_refresh(self):
         """手动刷新端口监控"""
         self.add_log("手动刷新端口监控...", "INFO")
+        self._port_wake_event.set()
         try:
             new_data = self.scan_port_occupation()
             self.port_occupation_data = new_data
@@ -300,6 +640,7 @@ class ServiceManagerGUI:
     def clean_conflicting_ports(self):
         """清理冲突端口进程"""
         self.add_log("开始清理冲突端口进程...", "INFO")
+        self._port_wake_event.set()
         
         system_ports = [self.backend_port, self.frontend_port]
         conflicting_processes = []
@@ -311,12 +652,7 @@ class ServiceManagerGUI:
                 process_name = data['process_name']
                 
                 # 检查是否是我们自己的服务进程
-                is_our_process = (
-                    (port == self.backend_port and pid == str(self.backend_pid)) or
-                    (port == self.frontend_port and pid == str(self.vite_pid))
-                )
-                
-                if not is_our_process:
+                if not self._is_our_service(port, pid):
                     conflicting_processes.append((port, pid, process_name))
         
         if not conflicting_processes:
@@ -331,18 +667,18 @@ class ServiceManagerGUI:
             else:
                 self.add_log(f"❌ 清理端口{port}的进程失败", "ERROR")
         
-        # 等待一下然后刷新监控
-        import time
-        time.sleep(2)
-        self.manual_port_refresh()
+        # 等待一下然后刷新监控，不阻塞界面
+        self.root.after(2000, self.manual_port_refresh)
     
     def create_config_diagnosis_frame(self, parent, row):
         """创建配置诊断框架"""
         diag_frame = ttk.LabelFrame(parent, text="⚠️ 配置诊断", padding="10")
+        self.diag_frame = diag_frame
         diag_frame.grid(row=row, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 10))
         
         # 创建滚动文本框显示诊断结果
         diag_text = tk.Text(diag_frame, height=4, wrap=tk.WORD, font=('Consolas', 9))
+        self.diag_text = diag_text
         diag_text.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=(0, 5))
         
         # 滚动条
@@ -355,11 +691,6 @@ class ServiceManagerGUI:
         diag_text.tag_configure("warning", foreground="orange", font=('Consolas', 9))
         diag_text.tag_configure("info", foreground="blue", font=('Consolas', 9))
         
-        # 插入诊断结果
-        for issue in self.config_issues:
-            issue_text = f"[{issue['type'].upper()}] {issue['message']}\n"
-            diag_text.insert(tk.END, issue_text, issue['type'])
-        
         # 添加重新诊断按钮
         recheck_btn = ttk.Button(diag_frame, text="🔄 重新检查配置", 
                                 command=self.recheck_configuration)
@@ -367,22 +698,48 @@ class ServiceManagerGUI:
         
         diag_frame.columnconfigure(0, weight=1)
         
+        self._fill_diag_text()
+    
+    def _fill_diag_text(self):
+        """将诊断结果写入诊断文本框"""
+        self.diag_text.config(state=tk.NORMAL)
+        self.diag_text.delete("1.0", tk.END)
+        for issue in self.config_issues:
+            issue_text = f"[{issue['type'].upper()}] {issue['message']}\n"
+            self.diag_text.insert(tk.END, issue_text, issue['type'])
         # 设置只读
-        diag_text.config(state=tk.DISABLED)
+        self.diag_text.config(state=tk.DISABLED)
+    
+    def _async_diagnose(self):
+        """后台执行配置诊断，完成后回到界面线程显示结果"""
+        self.diagnose_configuration()
+        self.root.after(0, self._apply_diagnosis_result)
     
     def recheck_configuration(self):
         """重新检查配置"""
         self.diagnose_configuration()
-        # 重新创建界面
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        self.create_widgets()
+        self._apply_diagnosis_result()
         self.add_log("配置重新检查完成", "INFO")
     
+    def _apply_diagnosis_result(self):
+        """显示诊断结果 - 只更新诊断区域，不重建整个界面"""
+        if self.config_issues:
+            if self.diag_frame is None:
+                self.create_config_diagnosis_frame(self.main_frame, row=1)
+            else:
+                self.diag_frame.grid()
+                self._fill_diag_text()
+            self.status_frame.grid(row=2)
+        elif self.diag_frame is not None:
+            # 问题已全部解决，隐藏诊断区域
+            self.diag_frame.grid_remove()
+            self.status_frame.grid(row=1)
+    
     def create_widgets(self):
         """创建界面组件"""
         # 主框架
         main_frame = ttk.Frame(self.root, padding="10")
+        self.main_frame = main_frame
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # 配置网格权重
@@ -397,6 +754,7 @@ class ServiceManagerGUI:
         title_label.grid(row=0, column=0, columnspan=3, pady=(0, 10))
         
         # 配置诊断框架 - 如果有问题才显示
+        self.diag_frame = None
         if self.config_issues:
             self.create_config_diagnosis_frame(main_frame, row=1)
             status_row = 2
@@ -405,6 +763,7 @@ class ServiceManagerGUI:
         
         # 服务状态框架 - 显化端口信息
         status_frame = ttk.LabelFrame(main_frame, text="📊 服务状态监控", padding="10")
+        self.status_frame = status_frame
         status_frame.grid(row=status_row, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 10))
         status_frame.columnconfigure(1, weight=1)
         status_frame.columnconfigure(3, weight=1)
@@ -535,7 +894,9 @@ class ServiceManagerGUI:
                   command=self.clean_conflicting_ports).pack(side=tk.RIGHT, padx=(5, 0))
         
         # 端口状态显示区域
-        self.port_text = tk.Text(port_frame, height=6, wrap=tk.WORD, font=('Consolas', 9))
+        # 端口状态行都很短，不换行、不记录撤销，每次刷新无需重新计算折行
+        self.port_text = tk.Text(port_frame, height=6, wrap=tk.NONE, font=('Consolas', 9),
+                                 undo=False, autoseparators=False, maxundo=0)
         self.port_text.grid(row=1, column=0, sticky=(tk.W, tk.E), padx=(0, 5))
         
         # 端口显示滚动条
@@ -627,11 +988,19 @@ class ServiceManagerGUI:
                                        foreground="gray")
         self.log_stats_label.pack(side=tk.RIGHT, padx=(5, 0))
         
-        # 日志文本区域
-        self.log_text = scrolledtext.ScrolledText(log_frame, height=15, wrap=tk.WORD, 
-                                                font=('Consolas', 9))
+        # 日志文本区域 - 不换行、不记录撤销历史，减少每次插入的布局计算
+        self.log_text = scrolledtext.ScrolledText(log_frame, height=15, wrap=tk.NONE, 
+                                                font=('Consolas', 9), undo=False,
+                                                autoseparators=False, maxundo=0)
         self.log_text.grid(row=2, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
+        # 水平滚动条，用于查看较长的日志行
+        log_xscrollbar = ttk.Scrollbar(log_frame, orient=tk.HORIZONTAL, command=self.log_text.xview)
+        log_xscrollbar.grid(row=3, column=0, sticky=(tk.W, tk.E))
+        self.log_text.config(xscrollcommand=log_xscrollbar.set)
+        # 组件只保存最近的日志，滚动到顶部时再从内存存储补充更早的条目
+        self.log_text.config(yscrollcommand=self._on_log_yscroll)
+        
         # 配置日志文本标签 - 增强格式化
         self.log_text.tag_configure("INFO", foreground="#2e7d32", font=('Consolas', 9))
         self.log_text.tag_configure("WARN", foreground="#f57c00", font=('Consolas', 9, 'bold'))
@@ -639,69 +1008,147 @@ class ServiceManagerGUI:
         self.log_text.tag_configure("timestamp", foreground="#666666", font=('Consolas', 8))
         self.log_text.tag_configure("highlight", background="#ffeb3b", font=('Consolas', 9, 'bold'))
         
+        # 设置只读，仅在写入日志时临时开启
+        self.log_text.config(state=tk.DISABLED)
+        self._apply_level_filter()
+        
         # 初始化日志
         self.add_log("服务管理器已启动", "INFO")
         self._update_log_stats()
     
     def add_log(self, message, level="INFO", source="system"):
         """添加日志消息"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"[{timestamp}] [{level}] {message}\n"
-        
-        # 根据消息来源分类存储
-        if source == "backend" or "[后端-" in message:
-            self.backend_logs.append(log_entry)
-            source = "backend"
-        elif source == "frontend" or "[前端-" in message:
-            self.frontend_logs.append(log_entry)
-            source = "frontend"
-        else:
-            self.system_logs.append(log_entry)
-            source = "system"
-        
-        # 限制每个日志类型的条目数量
-        if len(self.backend_logs) > 500:
-            self.backend_logs = self.backend_logs[-500:]
-        if len(self.frontend_logs) > 500:
-            self.frontend_logs = self.frontend_logs[-500:]
-        if len(self.system_logs) > 500:
-            self.system_logs = self.system_logs[-500:]
-        
-        # 如果当前显示的是对应的日志类型，则立即更新显示
-        if source == self.current_log_tab:
-            self.log_queue.put(log_entry)
-    
-    def log_process_loop(self):
-        """日志处理循环"""
-        while True:
+        self.add_logs(((message, level, source),))
+    
+    def add_logs(self, records):
+        """批量添加日志消息
+        
+        records为 (消息, 级别, 来源) 序列，属于当前标签的日志合并为一个队列项。
+        """
+        timestamp = _cached_timestamp("%Y-%m-%d %H:%M:%S")
+        visible = []
+        
+        with self._log_store_lock:
+            # 在锁内读取显示版本：整体重绘在同一把锁内递增版本并复制存储，
+            # 这批日志要么已在重绘的副本中(队列副本随之作废)，要么带着新版本入队
+            epoch = self._log_view_epoch
+            for message, level, source in records:
+                log_entry = LogEntry(timestamp, level, message)
+                
+                # 根据消息来源分类存储
+                if source == "backend" or "[后端-" in message:
+                    logs = self.backend_logs
+                    source = "backend"
+                elif source == "frontend" or "[前端-" in message:
+                    logs = self.frontend_logs
+                    source = "frontend"
+                else:
+                    logs = self.system_logs
+                    source = "system"
+                
+                # 缓冲区已满时追加会淘汰最旧的一条，同步扣减其级别计数
+                counts = self.log_level_counts[source]
+                if len(logs) == logs.maxlen:
+                    counts[logs[0].level] -= 1
+                logs.append(log_entry)
+                counts[level] += 1
+                
+                # 只有当前显示的日志类型才进入显示队列，其他标签切换时再从内存一次性渲染
+                if source == self.current_log_tab:
+                    visible.append(log_entry)
+        
+        if visible:
             try:
-                log_entry = self.log_queue.get(timeout=0.1)
-                self.root.after(0, self._update_log_display, log_entry)
-            except queue.Empty:
-                continue
-    
-    def _update_log_display(self, log_entry):
-        """更新日志显示"""
-        # 检查是否符合级别过滤
-        level_filter = getattr(self, 'log_level_var', None)
-        if level_filter and level_filter.get() != "ALL":
-            if f"] [{level_filter.get()}]" not in log_entry:
-                return
+                self.log_queue.put_nowait((epoch, visible))
+            except queue.Full:
+                try:
+                    self.log_queue.get_nowait()
+                except queue.Empty:
+                    pass
+                try:
+                    self.log_queue.put_nowait((epoch, visible))
+                except queue.Full:
+                    pass
+    
+    def _drain_log_queue(self):
+        """由界面线程定时调用，批量取出队列中的日志并一次写入显示"""
+        batches = []
+        try:
+            while len(batches) < self._LOG_BATCH_SIZE:
+                batches.append(self.log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        try:
+            if batches:
+                self._flush_log_batch(batches)
+        finally:
+            self.root.after(self._LOG_DRAIN_MS if batches else self._LOG_DRAIN_IDLE_MS,
+                            self._drain_log_queue)
+    
+    def _flush_log_batch(self, batches):
+        """将一批日志写入显示，batches为 (显示版本, 日志列表) 队列项"""
+        # 日志区域不可见(窗口最小化或日志区被隐藏)时不写入组件，
+        # 日志已保存在内存中，重新显示时统一刷新
+        if not self._window_visible or not self.log_text.winfo_viewable():
+            self._log_view_stale = True
+            return
         
-        # 使用格式化插入
-        self._insert_formatted_log(log_entry)
+        # 丢弃整体重绘(切换标签、过滤、清空)之前入队的日志，避免重复或串到其他标签
+        entries = [entry for epoch, batch in batches if epoch == self._log_view_epoch for entry in batch]
         
-        # 自动滚动
-        if getattr(self, 'auto_scroll_var', None) and self.auto_scroll_var.get():
-            self.log_text.see(tk.END)
+        if not entries:
+            return
         
-        # 更新统计
-        self._update_log_stats()
+        with self._batch_log_updates():
+            # 使用格式化插入，整批只调用一次insert
+            self._insert_formatted_log(entries)
+            
+            # 限制日志行数 - 按行计数判断，超过阈值时一次性删除最旧的行
+            # 向上翻看更早日志时按展开后的条目数裁剪
+            extra = self._log_view_size - self._LOG_DISPLAY_LINES
+            if self._log_line_count > self._LOG_TRIM_THRESHOLD + extra:
+                excess = self._log_line_count - self._log_view_size
+                self.log_text.delete("1.0", f"{excess + 1}.0")
+                self._log_line_count = self._log_view_size
+        
+        # 更新统计(合并到下一次定时刷新)
+        self._schedule_log_stats()
+    
+    @contextmanager
+    def _batch_log_updates(self, scroll=True):
+        """批量修改日志组件：进入时解除只读，退出时恢复只读并按需滚动到底部
         
-        # 限制日志行数
-        lines = self.log_text.get("1.0", tk.END).split('\n')
-        if len(lines) > 200:
-            self.log_text.delete("1.0", f"{len(lines) - 200}.0")
+        插入、裁剪等修改全部完成后才滚动一次，Tk只需在空闲时做一次布局。
+        """
+        self.log_text.config(state=tk.NORMAL)
+        try:
+            yield self.log_text
+        finally:
+            self.log_text.config(state=tk.DISABLED)
+            if scroll and getattr(self, 'auto_scroll_var', None) and self.auto_scroll_var.get():
+                self.log_text.see(tk.END)
+    
+    def _on_log_yscroll(self, first, last):
+        """日志滚动回调：更新滚动条，滚动到顶部时加载更早的日志，回到底部时恢复默认窗口"""
+        self.log_text.vbar.set(first, last)
+        if float(first) <= 0.0 and float(last) < 1.0:
+            if not self._log_page_pending and self._log_view_size < self._current_log_count():
+                self._log_page_pending = True
+                self.root.after_idle(self._load_earlier_logs)
+        elif float(last) >= 1.0 and self._log_view_size > self._LOG_DISPLAY_LINES:
+            # 多展开的行留给下一次写入时的裁剪处理
+            self._log_view_size = self._LOG_DISPLAY_LINES
+    
+    def _load_earlier_logs(self):
+        """在日志组件中多展开一页更早的日志，并保持当前查看的位置"""
+        self._log_page_pending = False
+        if float(self.log_text.yview()[0]) > 0.0:
+            return
+        old_lines = self._log_line_count
+        self._log_view_size = min(self._log_view_size + self._LOG_DISPLAY_LINES, self._LOG_HISTORY_SIZE)
+        self._refresh_filtered_logs(scroll=False)
+        # 新增的行都在原内容之前，滚动到原来的第一行
+        self.log_text.yview(f"{self._log_line_count - old_lines + 1}.0")
     
     def switch_log_tab(self, tab_name):
         """切换日志标签"""
@@ -715,54 +1162,88 @@ class ServiceManagerGUI:
         }
         self.current_tab_label.config(text=tab_labels.get(tab_name, "[ 未知 ]"))
         
-        # 使用增强的过滤刷新
+        # 使用增强的过滤刷新，新标签从最近一页日志开始显示
+        self._log_view_size = self._LOG_DISPLAY_LINES
         self._refresh_filtered_logs()
         self._update_log_stats()
     
     def status_update_loop(self):
-        """状态更新循环"""
+        """状态更新循环 - 状态稳定时逐步放宽检查间隔，进程退出或启停操作时立即检查"""
+        interval = self._STATUS_POLL_MIN
+        last_status = None
         while True:
             try:
                 self.check_service_status()
-                time.sleep(2)  # 每2秒检查一次
+                status = (self.backend_status, self.frontend_status)
+                if status != last_status:
+                    last_status = status
+                    interval = self._STATUS_POLL_MIN
+                else:
+                    interval = min(interval * 1.5, self._STATUS_POLL_MAX)
+                
+                if self._status_wake_event.wait(interval):
+                    self._status_wake_event.clear()
+                    interval = self._STATUS_POLL_MIN
             except Exception as e:
-                print(f"状态检查错误: {e}")
+                self.add_log(f"状态检查错误: {e}", "ERROR")
                 time.sleep(5)
     
+    def _watch_process_exit(self, process):
+        """服务进程启动后立即唤醒状态检查，并在后台等待其退出，退出时再次唤醒"""
+        self._status_wake_event.set()
+        
+        def wait_exit():
+            try:
+                process.wait()
+            finally:
+                self._status_wake_event.set()
+        threading.Thread(target=wait_exit, daemon=True).start()
+    
+    def _port_open(self, port):
+        """快速检查本地端口是否有服务在监听"""
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        s.settimeout(0.1)
+        try:
+            s.connect(('127.0.0.1', port))
+            return True
+        except OSError:
+            return False
+        finally:
+            s.close()
+    
     def check_service_status(self):
         """检查服务状态"""
+        # 丢弃已不再跟踪的PID对应的进程对象
+        tracked = {self.backend_pid, self.frontend_pid, self.vite_pid, self.electron_pid}
+        for pid in [pid for pid in list(self._service_procs) if pid not in tracked]:
+            self._service_procs.pop(pid, None)
+        
+        # 两个检查互不依赖，并行执行，一个服务无响应时不拖慢另一个
+        frontend_check = self._probe_pool.submit(self.check_frontend_status)
         self.check_backend_status()
-        self.check_frontend_status()
+        frontend_check.result()
     
     def check_backend_status(self):
         """检查后端服务状态"""
         # 先检查进程是否存在
-        if self.backend_pid:
-            try:
-                process = psutil.Process(self.backend_pid)
-                if not process.is_running():
-                    # 进程已退出
-                    self.backend_status = "stopped"
-                    self.backend_pid = None
-                    self.root.after(0, self._update_backend_status_display, "已停止", "gray")
-                    return False
-            except psutil.NoSuchProcess:
-                # 进程不存在
-                self.backend_status = "stopped"
-                self.backend_pid = None
-                self.root.after(0, self._update_backend_status_display, "已停止", "gray")
-                return False
+        if self.backend_pid and not self.is_process_running(self.backend_pid):
+            # 进程已退出
+            self.backend_status = "stopped"
+            self.backend_pid = None
+            self.root.after(0, self._update_backend_status_display, "已停止", "gray")
+            return False
         
-        # 检查健康状态
-        try:
-            response = requests.get(f"http://127.0.0.1:{self.backend_port}/healthz", 
-                                  timeout=3)
-            if response.status_code == 200:
-                self.backend_status = "running"
-                self.root.after(0, self._update_backend_status_display, "运行中", "green")
-                return True
-        except:
-            pass
+        # 检查健康状态 - 端口未监听时无需发起HTTP请求
+        if self._port_open(self.backend_port):
+            try:
+                response = self._http.get(f"http://127.0.0.1:{self.backend_port}/healthz", 
+                                          timeout=1)
+                if response.status_code == 200:
+                    self.backend_status = "running"
+                    self.root.after(0, self._update_backend_status_display, "运行中", "green")
+                    return True
+            except requests.RequestException:
+                pass
         
         # 如果有PID但健康检查失败，标记为异常
         if self.backend_pid:
@@ -778,32 +1259,24 @@ class ServiceManagerGUI:
     def check_frontend_status(self):
         """检查前端服务状态"""
         # 先检查进程是否存在
-        if self.frontend_pid:
-            try:
-                process = psutil.Process(self.frontend_pid)
-                if not process.is_running():
-                    # 进程已退出
-                    self.frontend_status = "stopped"
-                    self.frontend_pid = None
-                    self.root.after(0, self._update_frontend_status_display, "已停止", "gray")
-                    return False
-            except psutil.NoSuchProcess:
-                # 进程不存在
-                self.frontend_status = "stopped"
-                self.frontend_pid = None
-                self.root.after(0, self._update_frontend_status_display, "已停止", "gray")
-                return False
+        if self.frontend_pid and not self.is_process_running(self.frontend_pid):
+            # 进程已退出
+            self.frontend_status = "stopped"
+            self.frontend_pid = None
+            self.root.after(0, self._update_frontend_status_display, "已停止", "gray")
+            return False
         
-        # 检查前端服务端口
-        try:
-            response = requests.get(f"http://127.0.0.1:{self.frontend_port}", 
-                                  timeout=3)
-            if response.status_code == 200:
-                self.frontend_status = "running"
-                self.root.after(0, self._update_frontend_status_display, "运行中", "green")
-                return True
-        except:
-            pass
+        # 检查前端服务端口 - 端口未监听时无需发起HTTP请求
+        if self._port_open(self.frontend_port):
+            try:
+                response = self._http.get(f"http://127.0.0.1:{self.frontend_port}", 
+                                          timeout=1)
+                if response.status_code == 200:
+                    self.frontend_status = "running"
+                    self.root.after(0, self._update_frontend_status_display, "运行中", "green")
+                    return True
+            except requests.RequestException:
+                pass
         
         # 如果有PID但端口检查失败，可能正在启动中
         if self.frontend_pid:
@@ -842,8 +1315,8 @@ class ServiceManagerGUI:
         
         try:
             # 切换到后端目录
-            backend_path = os.path.join(os.getcwd(), "backend")
-            if not os.path.exists(backend_path):
+            backend_path = self.backend_path
+            if not self._dir_exists(backend_path):
                 self.add_log(f"后端路径不存在: {backend_path}", "ERROR")
                 return
             
@@ -853,16 +1326,18 @@ class ServiceManagerGUI:
                 python_cmd, "app/main.py", 
                 "--port", str(self.backend_port),
                 "--host", "127.0.0.1"
-            ], cwd=backend_path, 
+            ], cwd=backend_path, env=_BACKEND_ENV,
                stdout=subprocess.PIPE, 
                stderr=subprocess.PIPE,
-               text=True, bufsize=1, encoding='utf-8', errors='replace')
+               bufsize=0)
             
             self.backend_pid = self.backend_process.pid
+            self._track_service_process(self.backend_pid)
+            self._watch_process_exit(self.backend_process)
             self.add_log(f"后端服务启动命令已发送，PID: {self.backend_pid}", "INFO")
             
-            # 启动输出监控线程
-            threading.Thread(target=self._monitor_backend_output, daemon=True).start()
+            # 注册输出监控(不阻塞)，停止服务前监控列表已就绪
+            self._monitor_backend_output()
             
         except Exception as e:
             self.add_log(f"启动后端服务失败: {e}", "ERROR")
@@ -877,25 +1352,31 @@ class ServiceManagerGUI:
         
         try:
             # 切换到前端目录
-            frontend_path = os.path.join(os.getcwd(), "frontend")
-            if not os.path.exists(frontend_path):
+            frontend_path = self.frontend_path
+            if not self._dir_exists(frontend_path):
                 self.add_log(f"前端路径不存在: {frontend_path}", "ERROR")
                 return
             
+            npm_exe = _resolve_executable("npm")
+            if not npm_exe:
+                self.add_log("未找到npm可执行文件，请确认Node.js已安装", "ERROR")
+                return
+            
             # 启动前端开发服务器
             self.frontend_process = subprocess.Popen([
-                "npm", "run", "dev"
+                npm_exe, "run", "dev"
             ], cwd=frontend_path, 
                stdout=subprocess.PIPE, 
                stderr=subprocess.PIPE,
-               text=True, bufsize=1,
-               shell=True, encoding='utf-8', errors='replace')
+               bufsize=0, creationflags=_NO_WINDOW_FLAGS)
             
             self.frontend_pid = self.frontend_process.pid
+            self._track_service_process(self.frontend_pid)
+            self._watch_process_exit(self.frontend_process)
             self.add_log(f"前端服务启动命令已发送，PID: {self.frontend_pid}", "INFO")
             
-            # 启动输出监控线程
-            threading.Thread(target=self._monitor_frontend_output, daemon=True).start()
+            # 注册输出监控(不阻塞)，停止服务前监控列表已就绪
+            self._monitor_frontend_output()
             
         except Exception as e:
             self.add_log(f"启动前端服务失败: {e}", "ERROR")
@@ -910,26 +1391,32 @@ class ServiceManagerGUI:
         
         try:
             # 切换到前端目录
-            frontend_path = os.path.join(os.getcwd(), "frontend")
-            if not os.path.exists(frontend_path):
+            frontend_path = self.frontend_path
+            if not self._dir_exists(frontend_path):
                 self.add_log(f"前端路径不存在: {frontend_path}", "ERROR")
                 return
             
+            npm_exe = _resolve_executable("npm")
+            if not npm_exe:
+                self.add_log("未找到npm可执行文件，请确认Node.js已安装", "ERROR")
+                self.vite_status_label.config(text="启动失败", foreground="red")
+                return
+            
             # 启动Vite开发服务器
             self.vite_process = subprocess.Popen([
-                "npm", "run", "dev"
+                npm_exe, "run", "dev"
             ], cwd=frontend_path, 
                stdout=subprocess.PIPE, 
                stderr=subprocess.PIPE,
-               text=True, bufsize=1,
-               shell=True, encoding='utf-8', errors='replace')
+               bufsize=0, creationflags=_NO_WINDOW_FLAGS)
             
             self.vite_pid = self.vite_process.pid
+            self._track_service_process(self.vite_pid)
             self.add_log(f"Vite开发服务器启动中，PID: {self.vite_pid}", "INFO")
             self.vite_status_label.config(text="启动中...", foreground="orange")
             
-            # 启动Vite输出监控线程
-            threading.Thread(target=self._monitor_vite_output, daemon=True).start()
+            # 注册Vite输出监控(不阻塞)
+            self._monitor_vite_output()
             
             # 启动Vite状态检查线程
             threading.Thread(target=self._check_vite_ready, daemon=True).start()
@@ -945,6 +1432,7 @@ class ServiceManagerGUI:
             return
         
         self.add_log("正在停止Vite开发服务器...", "INFO")
+        process = getattr(self, 'vite_process', None)
         
         try:
             if hasattr(self, 'vite_process') and self.vite_process:
@@ -952,17 +1440,14 @@ class ServiceManagerGUI:
                 self.vite_process.wait(timeout=5)
             else:
                 # 通过PID终止进程
-                import os
-                if os.name == 'nt':  # Windows
-                    os.system(f'taskkill //PID {self.vite_pid} //F')
-                else:  # Unix/Linux
-                    os.system(f'kill -9 {self.vite_pid}')
+                self._force_kill(self.vite_pid)
             
             self.add_log("Vite服务器已停止", "INFO")
             
         except Exception as e:
             self.add_log(f"停止Vite服务器失败: {e}", "ERROR")
         finally:
+            self._release_process_monitors(process, self._vite_monitors)
             self.vite_pid = None
             self.vite_process = None
             self.vite_status_label.config(text="已停止", foreground="gray")
@@ -979,23 +1464,29 @@ class ServiceManagerGUI:
         self.add_log("🖥️ 步骤2：正在启动Electron桌面应用...", "INFO")
         
         try:
-            frontend_path = os.path.join(os.getcwd(), "frontend")
+            frontend_path = self.frontend_path
+            
+            npx_exe = _resolve_executable("npx")
+            if not npx_exe:
+                self.add_log("未找到npx可执行文件，请确认Node.js已安装", "ERROR")
+                self.electron_status_label.config(text="启动失败", foreground="red")
+                return
             
             # 启动Electron应用
             self.electron_process = subprocess.Popen([
-                "npx", "electron", "electron/main.js"
+                npx_exe, "electron", "electron/main.js"
             ], cwd=frontend_path,
                stdout=subprocess.PIPE, 
                stderr=subprocess.PIPE,
-               text=True, bufsize=1,
-               shell=True, encoding='utf-8', errors='replace')
+               bufsize=0, creationflags=_NO_WINDOW_FLAGS)
             
             self.electron_pid = self.electron_process.pid
+            self._track_service_process(self.electron_pid)
             self.add_log(f"Electron桌面应用已启动，PID: {self.electron_pid}", "INFO")
             self.electron_status_label.config(text="运行中", foreground="green")
             
-            # 监控Electron输出
-            threading.Thread(target=self._monitor_electron_output, daemon=True).start()
+            # 注册Electron输出监控(不阻塞)
+            self._monitor_electron_output()
             
         except Exception as e:
             self.add_log(f"启动Electron应用失败: {e}", "ERROR")
@@ -1008,58 +1499,106 @@ class ServiceManagerGUI:
             return
         
         self.add_log("正在关闭Electron桌面应用...", "INFO")
+        process = getattr(self, 'electron_process', None)
         
         try:
             if hasattr(self, 'electron_process') and self.electron_process:
                 self.electron_process.terminate()
                 self.electron_process.wait(timeout=5)
             else:
-                import os
-                if os.name == 'nt':  # Windows
-                    os.system(f'taskkill //PID {self.electron_pid} //F')
-                else:  # Unix/Linux
-                    os.system(f'kill -9 {self.electron_pid}')
+                self._force_kill(self.electron_pid)
             
             self.add_log("Electron应用已关闭", "INFO")
             
         except Exception as e:
             self.add_log(f"关闭Electron应用失败: {e}", "ERROR")
         finally:
+            self._release_process_monitors(process, self._electron_monitors)
             self.electron_pid = None
             self.electron_process = None
             self.electron_status_label.config(text="已关闭", foreground="gray")
     
-    def is_process_running(self, pid):
-        """检查进程是否在运行"""
-        if not pid:
+    def _dir_exists(self, path):
+        """检查目录是否存在，确认存在后缓存结果"""
+        if path in self._verified_dirs:
+            return True
+        if os.path.isdir(path):
+            self._verified_dirs.add(path)
+            return True
+        return False
+    
+    def _track_service_process(self, pid):
+        """服务启动后立即缓存其psutil.Process对象，记录启动时的创建时间"""
+        try:
+            self._service_procs[pid] = psutil.Process(pid)
+        except psutil.NoSuchProcess:
+            self._service_procs.pop(pid, None)
+    
+    def _is_our_service(self, port, pid):
+        """判断端口占用进程是否为本程序启动的服务(PID相同且未被复用)"""
+        if port == self.backend_port:
+            expected = self.backend_pid
+        elif port == self.frontend_port:
+            expected = self.vite_pid
+        else:
             return False
+        return pid is not None and pid == expected and self.is_process_running(pid)
+    
+    def _force_kill(self, pid):
+        """强制结束进程并等待其退出(不经过shell)，进程已不存在时直接返回"""
         try:
             process = psutil.Process(pid)
-            return process.is_running()
+            process.kill()
+            process.wait(timeout=3)
         except psutil.NoSuchProcess:
+            pass
+    
+    def is_process_running(self, pid):
+        """检查进程是否在运行
+        
+        同一PID复用缓存的psutil.Process对象，is_running()会比对创建时间，PID被复用时同样返回False。
+        """
+        if not pid:
             return False
+        # 进程已不存在时直接返回，不必构造Process对象
+        if not psutil.pid_exists(pid):
+            self._service_procs.pop(pid, None)
+            return False
+        process = self._service_procs.get(pid)
+        if process is None:
+            try:
+                process = psutil.Process(pid)
+            except psutil.NoSuchProcess:
+                return False
+            self._service_procs[pid] = process
+        if process.is_running():
+            return True
+        self._service_procs.pop(pid, None)
+        return False
     
     def _check_vite_ready(self):
         """检查Vite服务是否就绪"""
-        import time
-        # 先等待3秒，给Vite足够时间完全启动并绑定端口
-        time.sleep(3)
-        
-        max_attempts = 30  # 最多等待30秒
-        attempt = 0
+        url = f"http://127.0.0.1:{self.frontend_port}"
+        deadline = time.monotonic() + 30  # 最多等待30秒
+        delay = 0.2
         
-        while attempt < max_attempts:
+        while time.monotonic() < deadline:
             try:
-                response = requests.get(f"http://127.0.0.1:{self.frontend_port}", timeout=2)
+                # HEAD 不传输页面内容，复用会话连接
+                response = self._http.head(url, timeout=0.5, allow_redirects=False)
                 if response.status_code == 200:
                     # Vite就绪，启用Electron按钮
                     self.root.after(0, self._vite_ready_callback)
                     return
-            except:
+            except requests.ConnectionError:
+                # 端口尚未监听，按退避间隔快速重试
                 pass
+            except requests.RequestException:
+                # 已连上但响应慢，按最长间隔等待，避免压垮慢机器
+                delay = 1.5
             
-            time.sleep(1)
-            attempt += 1
+            time.sleep(delay)
+            delay = min(delay * 1.3, 1.5)
         
         # 超时，Vite启动失败
         self.root.after(0, self._vite_failed_callback)
@@ -1082,43 +1621,36 @@ class ServiceManagerGUI:
         if not hasattr(self, 'vite_process') or not self.vite_process:
             return
         
-        def monitor_stdout():
-            for line in iter(self.vite_process.stdout.readline, ''):
-                if line:
-                    line_content = line.strip()
-                    self.add_log(f"[Vite] {line_content}", "INFO", "frontend")
+        def on_stdout(lines):
+            self.add_logs([(f"[Vite] {line.strip()}", "INFO", "frontend") for line in lines if line])
         
-        def monitor_stderr():
-            for line in iter(self.vite_process.stderr.readline, ''):
+        def on_stderr(lines):
+            records = []
+            for line in lines:
                 if line:
                     line_content = line.strip()
                     if "deprecated" in line_content.lower():
-                        self.add_log(f"[Vite-WARN] {line_content}", "WARN", "frontend")
+                        records.append((f"[Vite-WARN] {line_content}", "WARN", "frontend"))
                     else:
-                        self.add_log(f"[Vite-ERR] {line_content}", "ERROR", "frontend")
+                        records.append((f"[Vite-ERR] {line_content}", "ERROR", "frontend"))
+            self.add_logs(records)
         
-        threading.Thread(target=monitor_stdout, daemon=True).start()
-        threading.Thread(target=monitor_stderr, daemon=True).start()
+        self._vite_monitors = self._watch_pipes((self.vite_process.stdout, on_stdout),
+                                                (self.vite_process.stderr, on_stderr))
     
     def _monitor_electron_output(self):
         """监控Electron应用输出"""
         if not hasattr(self, 'electron_process') or not self.electron_process:
             return
         
-        def monitor_stdout():
-            for line in iter(self.electron_process.stdout.readline, ''):
-                if line:
-                    line_content = line.strip()
-                    self.add_log(f"[Electron] {line_content}", "INFO", "frontend")
+        def on_stdout(lines):
+            self.add_logs([(f"[Electron] {line.strip()}", "INFO", "frontend") for line in lines if line])
         
-        def monitor_stderr():
-            for line in iter(self.electron_process.stderr.readline, ''):
-                if line:
-                    line_content = line.strip()
-                    self.add_log(f"[Electron-ERR] {line_content}", "ERROR", "frontend")
+        def on_stderr(lines):
+            self.add_logs([(f"[Electron-ERR] {line.strip()}", "ERROR", "frontend") for line in lines if line])
         
-        threading.Thread(target=monitor_stdout, daemon=True).start()
-        threading.Thread(target=monitor_stderr, daemon=True).start()
+        self._electron_monitors = self._watch_pipes((self.electron_process.stdout, on_stdout),
+                                                    (self.electron_process.stderr, on_stderr))
     
     def _monitor_backend_output(self):
         """监控后端服务输出"""
@@ -1126,28 +1658,22 @@ class ServiceManagerGUI:
             return
         
         # 监控stdout
-        def monitor_stdout():
-            for line in iter(self.backend_process.stdout.readline, ''):
-                if line:
-                    self.add_log(f"[后端-STDOUT] {line.strip()}", "INFO")
+        def on_stdout(lines):
+            self.add_logs([(f"[后端-STDOUT] {line.strip()}", "INFO", "system") for line in lines if line])
         
-        # 监控stderr  
-        def monitor_stderr():
-            for line in iter(self.backend_process.stderr.readline, ''):
+        # 监控stderr - 根据日志级别分类
+        def on_stderr(lines):
+            records = []
+            for line in lines:
                 if line:
                     line_content = line.strip()
-                    # 根据日志级别分类
-                    if "| INFO " in line_content:
-                        self.add_log(f"{line_content}", "INFO", "backend")
-                    elif "| ERROR " in line_content:
-                        self.add_log(f"{line_content}", "ERROR", "backend")
-                    elif "| WARNING " in line_content or "| WARN " in line_content:
-                        self.add_log(f"{line_content}", "WARN", "backend")
-                    else:
-                        self.add_log(f"{line_content}", "ERROR", "backend")
+                    level = _classify_backend_level(line_content)
+                    if level:
+                        records.append((line_content, level, "backend"))
+            self.add_logs(records)
         
-        threading.Thread(target=monitor_stdout, daemon=True).start()
-        threading.Thread(target=monitor_stderr, daemon=True).start()
+        self._backend_monitors = self._watch_pipes((self.backend_process.stdout, on_stdout),
+                                                   (self.backend_process.stderr, on_stderr))
     
     def _monitor_frontend_output(self):
         """监控前端服务输出"""
@@ -1155,32 +1681,78 @@ class ServiceManagerGUI:
             return
         
         # 监控stdout
-        def monitor_stdout():
-            for line in iter(self.frontend_process.stdout.readline, ''):
+        def on_stdout(lines):
+            records = []
+            for line in lines:
                 if line:
                     line_content = line.strip()
-                    self.add_log(f"{line_content}", "INFO", "frontend")
+                    records.append((f"{line_content}", "INFO", "frontend"))
                     
-                    # 从Vite输出中提取端口号
-                    if "Local:" in line_content and "localhost:" in line_content:
-                        import re
-                        port_match = re.search(r'localhost:(\d+)', line_content)
+                    # 从Vite输出中提取端口号：定位到"localhost:"后用锚定的match，不做逐位置搜索
+                    port_pos = line_content.find("localhost:") if "Local:" in line_content else -1
+                    if port_pos >= 0:
+                        port_match = _LOCALHOST_PORT_RE.match(line_content, port_pos)
                         if port_match:
                             self.frontend_port = int(port_match.group(1))
-                            self.add_log(f"检测到前端端口: {self.frontend_port}", "INFO", "system")
+                            records.append((f"检测到前端端口: {self.frontend_port}", "INFO", "system"))
+            self.add_logs(records)
         
         # 监控stderr  
-        def monitor_stderr():
-            for line in iter(self.frontend_process.stderr.readline, ''):
+        def on_stderr(lines):
+            records = []
+            for line in lines:
                 if line:
                     line_content = line.strip()
                     if "deprecated" in line_content.lower():
-                        self.add_log(f"{line_content}", "WARN", "frontend")
+                        records.append((f"{line_content}", "WARN", "frontend"))
                     else:
-                        self.add_log(f"{line_content}", "ERROR", "frontend")
+                        records.append((f"{line_content}", "ERROR", "frontend"))
+            self.add_logs(records)
         
-        threading.Thread(target=monitor_stdout, daemon=True).start()
-        threading.Thread(target=monitor_stderr, daemon=True).start()
+        self._frontend_monitors = self._watch_pipes((self.frontend_process.stdout, on_stdout),
+                                                    (self.frontend_process.stderr, on_stderr))
+    
+    def _watch_pipes(self, *pipe_handlers):
+        """读取子进程管道，每次读到的一批行交给对应的处理函数
+        
+        POSIX下注册到共用的selectors读取线程，Windows下每个管道一个读取线程。
+        返回可等待的监控对象列表(Event或线程)。
+        """
+        if self._pipe_reader:
+            return [self._pipe_reader.watch(pipe, handler) for pipe, handler in pipe_handlers]
+        
+        def read_pipe(pipe, handler):
+            for lines in _iter_pipe_batches(pipe):
+                handler(lines)
+        
+        threads = [threading.Thread(target=read_pipe, args=pair, daemon=True) for pair in pipe_handlers]
+        for thread in threads:
+            thread.start()
+        return threads
+    
+    def _release_process_monitors(self, process, monitors):
+        """回收子进程输出监控：监控列表立即清空，等待和关闭管道交给后台线程"""
+        pending = list(monitors)
+        monitors.clear()
+        self._release_pool.submit(self._close_process_pipes, process, pending)
+    
+    def _close_process_pipes(self, process, monitors):
+        """等待输出读完(每个管道最多1秒)并关闭子进程管道(在后台线程中执行)"""
+        for monitor in monitors:
+            if isinstance(monitor, threading.Thread):
+                monitor.join(timeout=1)
+            else:
+                monitor.wait(timeout=1)
+        if process:
+            # 按PID停止时process是psutil.Process，没有管道
+            for pipe in (getattr(process, 'stdout', None), getattr(process, 'stderr', None)):
+                if pipe:
+                    if self._pipe_reader:
+                        self._pipe_reader.discard(pipe)
+                    try:
+                        pipe.close()
+                    except OSError:
+                        pass
     
     def stop_backend_service(self):
         """停止后端服务"""
@@ -1189,6 +1761,7 @@ class ServiceManagerGUI:
             return
         
         self.add_log("正在停止后端服务...", "INFO")
+        process = self.backend_process
         
         try:
             if self.backend_process:
@@ -1204,15 +1777,12 @@ class ServiceManagerGUI:
             # 尝试强制终止
             try:
                 if self.backend_pid:
-                    import os
-                    if os.name == 'nt':  # Windows
-                        os.system(f'taskkill //PID {self.backend_pid} //F')
-                    else:  # Unix/Linux
-                        os.system(f'kill -9 {self.backend_pid}')
+                    self._force_kill(self.backend_pid)
                 self.add_log("后端服务已强制停止", "INFO")
             except:
                 self.add_log(f"停止后端服务失败: {e}", "ERROR")
         finally:
+            self._release_process_monitors(process, self._backend_monitors)
             self.backend_process = None
             self.backend_pid = None
             self.backend_status = "stopped"
@@ -1226,6 +1796,7 @@ class ServiceManagerGUI:
             return
         
         self.add_log("正在停止前端服务...", "INFO")
+        process = self.frontend_process
         
         try:
             if self.frontend_process:
@@ -1241,15 +1812,12 @@ class ServiceManagerGUI:
             # 尝试强制终止
             try:
                 if self.frontend_pid:
-                    import os
-                    if os.name == 'nt':  # Windows
-                        os.system(f'taskkill //PID {self.frontend_pid} //F')
-                    else:  # Unix/Linux
-                        os.system(f'kill -9 {self.frontend_pid}')
+                    self._force_kill(self.frontend_pid)
                 self.add_log("前端服务已强制停止", "INFO")
             except:
                 self.add_log(f"停止前端服务失败: {e}", "ERROR")
         finally:
+            self._release_process_monitors(process, self._frontend_monitors)
             self.frontend_process = None
             self.frontend_pid = None
             self.frontend_status = "stopped"
@@ -1260,23 +1828,23 @@ class ServiceManagerGUI:
         """重启后端服务"""
         self.add_log("正在重启后端服务...", "INFO")
         self.stop_backend_service()
-        time.sleep(2)
-        self.start_backend_service()
+        # 2秒后再启动，期间界面保持响应
+        self.root.after(2000, self.start_backend_service)
     
     def restart_frontend_service(self):
         """重启前端服务"""
         self.add_log("正在重启前端服务...", "INFO")
         self.stop_frontend_service()
-        time.sleep(2)
-        self.start_frontend_service()
+        # 2秒后再启动，期间界面保持响应
+        self.root.after(2000, self.start_frontend_service)
     
     def health_check(self):
         """健康检查"""
         self.add_log("执行健康检查...", "INFO")
         
         try:
-            response = requests.get(f"http://127.0.0.1:{self.backend_port}/healthz", 
-                                  timeout=5)
+            response = self._http.get(f"http://127.0.0.1:{self.backend_port}/healthz", 
+                                      timeout=5)
             if response.status_code == 200:
                 data = response.json()
                 self.add_log(f"✅ 后端健康检查通过: {data}", "INFO")
@@ -1287,8 +1855,8 @@ class ServiceManagerGUI:
         
         # 检查前端服务
         try:
-            response = requests.get(f"http://127.0.0.1:{self.frontend_port}", 
-                                  timeout=5)
+            response = self._http.get(f"http://127.0.0.1:{self.frontend_port}", 
+                                      timeout=5)
             if response.status_code == 200:
                 self.add_log(f"✅ 前端健康检查通过", "INFO")
             else:
@@ -1310,8 +1878,8 @@ class ServiceManagerGUI:
         
         for endpoint, name in test_endpoints:
             try:
-                response = requests.get(f"http://127.0.0.1:{self.backend_port}{endpoint}", 
-                                      timeout=3)
+                response = self._http.get(f"http://127.0.0.1:{self.backend_port}{endpoint}", 
+                                          timeout=3)
                 if response.status_code == 200:
                     self.add_log(f"✅ {name}: 正常", "INFO")
                 else:
@@ -1320,50 +1888,53 @@ class ServiceManagerGUI:
                 self.add_log(f"❌ {name}: {e}", "ERROR")
     
     def kill_port_processes(self):
-        """清理占用端口的进程"""
+        """清理占用端口的进程(在后台线程中结束进程，界面保持响应)"""
         self.add_log("开始清理端口进程...", "INFO")
-        
+        self.kill_port_btn.config(state=tk.DISABLED)
         ports_to_check = [self.backend_port, self.frontend_port]
-        
-        for port in ports_to_check:
+        threading.Thread(target=self._kill_port_processes, args=(ports_to_check,), daemon=True).start()
+    
+    def _kill_port_processes(self, ports_to_check):
+        """结束在指定端口上监听的进程(在后台线程中执行)，完成后交回界面线程更新状态"""
+        try:
+            # 一次读取系统套接字表，找出在这些端口上监听的进程
             try:
-                # Windows命令查找占用端口的进程
-                import subprocess
-                result = subprocess.run(f'netstat -ano | findstr :{port}', 
-                                      shell=True, capture_output=True, text=True)
-                
-                if result.stdout:
-                    lines = result.stdout.strip().split('\n')
-                    pids = set()
-                    
-                    for line in lines:
-                        if 'LISTENING' in line:
-                            parts = line.split()
-                            if len(parts) >= 5:
-                                pid = parts[-1]
-                                if pid != '0':
-                                    pids.add(pid)
+                listeners = [
+                    conn for conn in psutil.net_connections(kind='inet')
+                    if conn.status == psutil.CONN_LISTEN and conn.laddr and conn.pid
+                ]
+            except (psutil.AccessDenied, OSError) as e:
+                self.add_log(f"读取端口占用信息失败: {e}", "ERROR")
+                listeners = []
+            
+            for port in ports_to_check:
+                try:
+                    pids = {conn.pid for conn in listeners if conn.laddr.port == port}
+                    if not pids:
+                        self.add_log(f"端口{port}未被占用", "INFO")
+                        continue
                     
                     for pid in pids:
                         try:
-                            subprocess.run(f'taskkill //PID {pid} //F', 
-                                         shell=True, capture_output=True)
+                            self._force_kill(pid)
                             self.add_log(f"已终止占用端口{port}的进程PID:{pid}", "INFO")
-                        except:
-                            pass
-                else:
-                    self.add_log(f"端口{port}未被占用", "INFO")
-                    
-            except Exception as e:
-                self.add_log(f"清理端口{port}失败: {e}", "ERROR")
-        
-        # 重置状态
+                        except psutil.Error as e:
+                            self.add_log(f"终止占用端口{port}的进程PID:{pid}失败: {e}", "WARN")
+                        
+                except Exception as e:
+                    self.add_log(f"清理端口{port}失败: {e}", "ERROR")
+        finally:
+            self.root.after(0, self._on_port_processes_killed)
+    
+    def _on_port_processes_killed(self):
+        """端口清理完成后重置服务状态(界面线程)"""
         self.backend_pid = None
         self.frontend_pid = None
         self.backend_status = "stopped"
         self.frontend_status = "stopped"
-        self.root.after(0, self._update_backend_status_display, "已停止", "gray")
-        self.root.after(0, self._update_frontend_status_display, "已停止", "gray")
+        self._update_backend_status_display("已停止", "gray")
+        self._update_frontend_status_display("已停止", "gray")
+        self.kill_port_btn.config(state=tk.NORMAL)
         
         self.add_log("端口清理完成", "INFO")
     
@@ -1371,26 +1942,40 @@ class ServiceManagerGUI:
         """打开前端界面"""
         import webbrowser
         url = f"http://localhost:{self.frontend_port}"  # 前端开发服务器端口
-        webbrowser.open(url)
+        # 启动浏览器可能较慢，放到后台线程避免阻塞界面
+        threading.Thread(target=webbrowser.open, args=(url,), daemon=True).start()
         self.add_log(f"已尝试打开前端界面: {url}", "INFO")
     
     def copy_selected_logs(self):
         """复制选中的日志"""
         try:
-            selected_text = self.log_text.get(tk.SEL_FIRST, tk.SEL_LAST)
-            self.root.clipboard_clear()
-            self.root.clipboard_append(selected_text)
+            # 只取可见字符，跳过被级别过滤隐藏(elide)的行
+            selected_text = self.log_text.tk.call(self.log_text._w, 'get', '-displaychars',
+                                                  tk.SEL_FIRST, tk.SEL_LAST)
+            self._set_clipboard(selected_text)
             self.add_log("已复制选中日志到剪贴板", "INFO")
         except tk.TclError:
             self.add_log("没有选中的日志内容", "WARN")
     
     def copy_all_logs(self):
         """复制全部当前标签日志"""
-        all_text = self.log_text.get("1.0", tk.END)
-        self.root.clipboard_clear()
-        self.root.clipboard_append(all_text)
+        # 直接从内存日志拼接，无需从文本组件读回内容；
+        # 锁内只复制条目，格式化在锁外进行，不阻塞读取线程写入
+        with self._log_store_lock:
+            entries = list(self._current_log_list())
+        all_text = "".join(map(str, entries))
+        if len(all_text) > 64 * 1024:
+            # 内容较大时延后到空闲时写入剪贴板，让按钮回调立即返回
+            self.root.after_idle(self._set_clipboard, all_text)
+        else:
+            self._set_clipboard(all_text)
         self.add_log(f"已复制{self.current_log_tab}日志到剪贴板", "INFO")
     
+    def _set_clipboard(self, text):
+        """写入剪贴板"""
+        self.root.clipboard_clear()
+        self.root.clipboard_append(text)
+    
     def refresh_current_logs(self):
         """刷新当前标签日志显示"""
         self.add_log("正在刷新日志显示...", "INFO")
@@ -1400,117 +1985,145 @@ class ServiceManagerGUI:
     def clear_current_logs(self):
         """清空当前标签日志"""
         # 清空对应的日志存储
-        if self.current_log_tab == "system":
-            self.system_logs = []
-        elif self.current_log_tab == "backend":
-            self.backend_logs = []
-        elif self.current_log_tab == "frontend":
-            self.frontend_logs = []
+        with self._log_store_lock:
+            if self.current_log_tab == "system":
+                self.system_logs.clear()
+            elif self.current_log_tab == "backend":
+                self.backend_logs.clear()
+            elif self.current_log_tab == "frontend":
+                self.frontend_logs.clear()
+            if self.current_log_tab in self.log_level_counts:
+                self.log_level_counts[self.current_log_tab].clear()
+            # 与清空存储在同一锁内递增版本，清空前入队的日志随之作废
+            self._log_view_epoch += 1
         
         # 清空显示
-        self.log_text.delete("1.0", tk.END)
+        with self._batch_log_updates():
+            self.log_text.delete("1.0", tk.END)
+        self._log_line_count = 0
         self.add_log(f"{self.current_log_tab}日志已清空", "INFO")
     
     def on_log_level_change(self, event=None):
         """日志级别过滤改变"""
-        self._refresh_filtered_logs()
-        self._update_log_stats()
+        self._apply_level_filter()
+        if self.auto_scroll_var.get():
+            self.log_text.see(tk.END)
+    
+    def _apply_level_filter(self):
+        """按当前过滤级别隐藏/显示日志行，不重建日志内容"""
+        selected = self.log_level_var.get()
+        for level in _LOG_LEVELS:
+            self.log_text.tag_configure(f"lvl-{level}", elide=(selected != "ALL" and level != selected))
     
     def on_log_search(self, event=None):
         """实时搜索日志"""
-        # 延迟搜索，避免频繁更新
-        if hasattr(self, '_search_timer'):
+        # 方向键、Shift等不改变搜索词的按键不触发重新搜索
+        if self._search_timer is None and self.log_search_var.get().strip() == self._highlighted_search:
+            return
+        # 延迟搜索，连续输入时只在停顿后执行一次
+        if self._search_timer is not None:
             self.root.after_cancel(self._search_timer)
-        self._search_timer = self.root.after(300, self.highlight_search_results)
+        self._search_timer = self.root.after(self._SEARCH_DEBOUNCE_MS, self.highlight_search_results)
     
     def highlight_search_results(self):
         """高亮搜索结果"""
+        self._search_timer = None
         search_text = self.log_search_var.get().strip()
+        self._highlighted_search = search_text
         
         # 清除之前的高亮
         self.log_text.tag_remove("highlight", "1.0", tk.END)
         
         if search_text:
-            # 搜索并高亮所有匹配项
-            start_pos = "1.0"
-            while True:
-                pos = self.log_text.search(search_text, start_pos, tk.END, nocase=True)
-                if not pos:
-                    break
-                end_pos = f"{pos}+{len(search_text)}c"
-                self.log_text.tag_add("highlight", pos, end_pos)
-                start_pos = end_pos
-    
-    def _refresh_filtered_logs(self):
-        """根据级别过滤刷新日志显示"""
-        level_filter = self.log_level_var.get()
-        
-        # 获取当前标签的日志
-        current_logs = []
-        if self.current_log_tab == "system":
-            current_logs = self.system_logs
-        elif self.current_log_tab == "backend":
-            current_logs = self.backend_logs
-        elif self.current_log_tab == "frontend":
-            current_logs = self.frontend_logs
+            # 一次取出全部文本在Python中匹配，再换算成行列索引，最后一次tag_add标记所有匹配项
+            text = self.log_text.get("1.0", "end-1c")
+            ranges = []
+            line_no, line_start, scanned = 1, 0, 0
+            for match in re.finditer(re.escape(search_text), text, re.IGNORECASE):
+                start, end = match.span()
+                newlines = text.count('\n', scanned, start)
+                if newlines:
+                    line_no += newlines
+                    line_start = text.rfind('\n', scanned, start) + 1
+                scanned = start
+                col = _tk_len(text[line_start:start])
+                ranges += (f"{line_no}.{col}", f"{line_no}.{col + _tk_len(text[start:end])}")
+            if ranges:
+                self.log_text.tag_add("highlight", *ranges)
+    
+    def _refresh_filtered_logs(self, scroll=True):
+        """重新渲染当前标签的日志(级别过滤由标签的elide属性处理)"""
+        # 在锁内复制当前标签最近的条目，读取线程同时追加时不会在遍历中途修改
+        with self._log_store_lock:
+            current_logs = self._current_log_list()
+            start = max(0, len(current_logs) - self._log_view_size)
+            entries = list(islice(current_logs, start, None))
+            # 与复制在同一锁内递增版本：副本之后写入的日志带新版本入队，不会丢失
+            self._log_view_epoch += 1
         
         # 清空显示
-        self.log_text.delete("1.0", tk.END)
-        
-        # 过滤并显示日志
-        for log_entry in current_logs[-200:]:  # 只显示最近200条
-            if level_filter == "ALL" or f"] [{level_filter}]" in log_entry:
-                self._insert_formatted_log(log_entry)
-        
-        if self.auto_scroll_var.get():
-            self.log_text.see(tk.END)
+        with self._batch_log_updates(scroll):
+            self.log_text.delete("1.0", tk.END)
+            self._log_line_count = 0
+            self._insert_formatted_log(entries)
     
-    def _insert_formatted_log(self, log_entry):
-        """插入格式化的日志条目"""
-        # 解析日志条目的各部分
-        import re
-        
-        # 匹配时间戳、级别和消息
-        pattern = r'^\[(.*?)\] \[(.*?)\] (.*)$'
-        match = re.match(pattern, log_entry.strip())
-        
-        if match:
-            timestamp, level, message = match.groups()
-            
-            # 插入时间戳
-            self.log_text.insert(tk.END, f"[{timestamp}] ", "timestamp")
-            
-            # 插入级别标签
-            self.log_text.insert(tk.END, f"[{level}] ", level)
-            
-            # 插入消息
-            self.log_text.insert(tk.END, f"{message}\n")
-        else:
-            # 如果解析失败，直接插入原始日志
-            self.log_text.insert(tk.END, log_entry)
+    def _current_log_list(self):
+        """获取当前标签对应的内存日志"""
+        if self.current_log_tab == "backend":
+            return self.backend_logs
+        if self.current_log_tab == "frontend":
+            return self.frontend_logs
+        if self.current_log_tab == "system":
+            return self.system_logs
+        return ()
+    
+    def _current_log_count(self):
+        """当前标签内存日志的条数(在锁内读取，与读取线程的追加互不干扰)"""
+        with self._log_store_lock:
+            return len(self._current_log_list())
+    
+    def _insert_formatted_log(self, log_entries):
+        """插入格式化的日志条目
+        
+        所有条目的文本与标签交替拼成参数，通过一次Text.insert写入；
+        每条日志的所有片段都带上 "lvl-级别" 标签，用于级别过滤。
+        """
+        segments = []
+        last_timestamp = ts_text = None
+        for timestamp, level, message in log_entries:
+            self._log_line_count += message.count('\n') + 1
+            # 不在预先生成的表中的级别(如DEBUG、SUCCESS)按INFO显示，避免整批写入失败
+            ts_tags, level_text, level_tags, msg_tags = _LOG_SEGMENT_TAGS.get(level, _LOG_SEGMENT_TAGS["INFO"])
+            # 同一秒内的日志共用时间戳文本，只格式化一次
+            if timestamp != last_timestamp:
+                last_timestamp = timestamp
+                ts_text = f"[{timestamp}] "
+            # 时间戳、级别标签、消息
+            segments += (ts_text, ts_tags,
+                         level_text, level_tags,
+                         f"{message}\n", msg_tags)
+        
+        if segments:
+            self.log_text.insert(tk.END, *segments)
+    
+    def _schedule_log_stats(self):
+        """安排一次日志统计刷新，间隔内的多次请求合并为一次"""
+        if self._stats_timer is None:
+            self._stats_timer = self.root.after(self._STATS_REFRESH_MS, self._update_log_stats)
     
     def _update_log_stats(self):
         """更新日志统计"""
-        # 统计当前标签的日志数量
-        current_logs = []
-        if self.current_log_tab == "system":
-            current_logs = self.system_logs
-        elif self.current_log_tab == "backend":
-            current_logs = self.backend_logs
-        elif self.current_log_tab == "frontend":
-            current_logs = self.frontend_logs
-        
-        # 按级别统计
-        stats = {"INFO": 0, "WARN": 0, "ERROR": 0}
-        for log in current_logs:
-            for level in stats.keys():
-                if f"] [{level}]" in log:
-                    stats[level] += 1
-                    break
+        if self._stats_timer is not None:
+            self.root.after_cancel(self._stats_timer)
+            self._stats_timer = None
+        # 在锁内读取当前标签按级别累计的计数，各级别取自同一时刻
+        with self._log_store_lock:
+            stats = self.log_level_counts.get(self.current_log_tab, Counter())
+            info, warn, error = stats['INFO'], stats['WARN'], stats['ERROR']
         
         # 更新统计显示
-        total = sum(stats.values())
-        stats_text = f"总计: {total} | INFO: {stats['INFO']} | WARN: {stats['WARN']} | ERROR: {stats['ERROR']}"
+        total = info + warn + error
+        stats_text = f"总计: {total} | INFO: {info} | WARN: {warn} | ERROR: {error}"
         
         if hasattr(self, 'log_stats_label'):
             self.log_stats_label.config(text=stats_text)
@@ -1529,6 +2142,10 @@ class ServiceManagerGUI:
                 self.stop_backend_service()
             if self.frontend_status == "running":
                 self.stop_frontend_service()
+            # 关闭后台线程池和HTTP会话，不等待进行中的检查
+            self._probe_pool.shutdown(wait=False, cancel_futures=True)
+            self._release_pool.shutdown(wait=False, cancel_futures=True)
+            self._http.close()
             self.root.destroy()
 
 
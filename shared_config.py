@@ -3,14 +3,62 @@
 避免多处硬编码端口号等配置
 """
 
+import copy
 import json
 import os
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
+
+
+def _flatten(config: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """将嵌套配置展开为点分路径到值的映射，中间层级的字典也保留"""
+    flat = {}
+    for key, value in config.items():
+        path = f"{prefix}{key}"
+        flat[path] = value
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{path}."))
+    return flat
+
+
+# 默认配置模板，导入时计算一次(包括数据库路径的展开)
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    "backend": {
+        "host": "127.0.0.1",
+        "port": 5318,
+        "debug": False,
+        "auto_restart": False,
+        "log_level": "INFO"
+    },
+    "frontend": {
+        "port": 5173,
+        "auto_start": False
+    },
+    "database": {
+        "path": os.path.expanduser("~/AppData/Roaming/QuantBacktest/data/data.duckdb") if os.name == 'nt' 
+               else os.path.expanduser("~/.local/share/QuantBacktest/data.duckdb")
+    },
+    "logging": {
+        "level": "INFO",
+        "max_files": 7,
+        "max_size_mb": 10
+    },
+    "monitoring": {
+        "check_interval": 10,
+        "restart_max_attempts": 3,
+        "health_timeout": 30
+    }
+}
 
 
 class ConfigManager:
-    """配置管理器"""
+    """配置管理器
+
+    get() 读取的是由 _config 展开的查找表，_config 只能通过 set() 或 load_config()
+    修改(二者都会调用 _rebuild_lookup 重建查找表)；各配置段属性返回只读视图，
+    直接修改会报错而不会得到过期的查找结果。
+    """
     
     def __init__(self, project_root: Optional[Path] = None):
         if project_root is None:
@@ -19,77 +67,65 @@ class ConfigManager:
         self.project_root = project_root
         self.config_file = project_root / "service_config.json"
         self._config = self._load_default_config()
+        self._flat: Dict[str, Any] = {}  # 点分路径查找表，配置变化时重建
+        self._url_cache: Dict[str, str] = {}  # 服务URL缓存，端口或主机变化时清空
+        self._rebuild_lookup()
+        self._config_mtime: Optional[int] = None  # 最近一次加载的配置文件修改时间
         self.load_config()
     
+    def _rebuild_lookup(self):
+        """_config变化后重建点分路径查找表并清空URL缓存"""
+        self._flat = _flatten(self._config)
+        self._url_cache.clear()
+    
     def _load_default_config(self) -> Dict[str, Any]:
-        """加载默认配置"""
-        return {
-            "backend": {
-                "host": "127.0.0.1",
-                "port": 5318,
-                "debug": False,
-                "auto_restart": False,
-                "log_level": "INFO"
-            },
-            "frontend": {
-                "port": 5173,
-                "auto_start": False
-            },
-            "database": {
-                "path": os.path.expanduser("~/AppData/Roaming/QuantBacktest/data/data.duckdb") if os.name == 'nt' 
-                       else os.path.expanduser("~/.local/share/QuantBacktest/data.duckdb")
-            },
-            "logging": {
-                "level": "INFO",
-                "max_files": 7,
-                "max_size_mb": 10
-            },
-            "monitoring": {
-                "check_interval": 10,
-                "restart_max_attempts": 3,
-                "health_timeout": 30
-            }
-        }
+        """加载默认配置(模板的独立副本，合并和修改不会影响模板)"""
+        return copy.deepcopy(_DEFAULT_CONFIG)
     
     def load_config(self):
-        """从文件加载配置"""
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    file_config = json.load(f)
-                    # 深度合并配置
-                    self._deep_merge(self._config, file_config)
-            except Exception as e:
-                print(f"警告：加载配置文件失败，使用默认配置: {e}")
+        """从文件加载配置，文件不存在或自上次加载后未修改时直接使用当前配置"""
+        try:
+            mtime = os.stat(self.config_file).st_mtime_ns
+        except OSError:
+            return
+        if mtime == self._config_mtime:
+            return
+        
+        try:
+            with open(self.config_file, 'r', encoding='utf-8') as f:
+                file_config = json.load(f)
+            # 深度合并配置
+            self._deep_merge(self._config, file_config)
+            self._config_mtime = mtime
+        except Exception as e:
+            print(f"警告：加载配置文件失败，使用默认配置: {e}")
+        self._rebuild_lookup()
     
     def save_config(self):
         """保存配置到文件"""
         try:
             with open(self.config_file, 'w', encoding='utf-8') as f:
                 json.dump(self._config, f, indent=2, ensure_ascii=False)
+            # 写入的就是当前配置，下次加载无需重新读取
+            self._config_mtime = os.stat(self.config_file).st_mtime_ns
         except Exception as e:
             print(f"错误：保存配置文件失败: {e}")
     
     def _deep_merge(self, base: Dict, override: Dict):
-        """深度合并配置"""
-        for key, value in override.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                self._deep_merge(base[key], value)
-            else:
-                base[key] = value
+        """深度合并配置(用栈代替递归)"""
+        stack = [(base, override)]
+        while stack:
+            base, override = stack.pop()
+            for key, value in override.items():
+                base_value = base.get(key)
+                if type(base_value) is dict and type(value) is dict:
+                    stack.append((base_value, value))
+                else:
+                    base[key] = value
     
     def get(self, key: str, default: Any = None) -> Any:
         """获取配置值，支持点分路径如 'backend.port'"""
-        keys = key.split('.')
-        value = self._config
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        
-        return value
+        return self._flat.get(key, default)
     
     def set(self, key: str, value: Any, save: bool = True):
         """设置配置值"""
@@ -102,55 +138,58 @@ class ConfigManager:
             config = config[k]
         
         config[keys[-1]] = value
+        self._rebuild_lookup()
         
         if save:
             self.save_config()
     
     @property
-    def backend(self) -> Dict[str, Any]:
+    def backend(self) -> Mapping[str, Any]:
         """获取后端配置"""
-        return self._config.get("backend", {})
+        return MappingProxyType(self._config.get("backend", {}))
     
     @property
-    def frontend(self) -> Dict[str, Any]:
+    def frontend(self) -> Mapping[str, Any]:
         """获取前端配置"""
-        return self._config.get("frontend", {})
+        return MappingProxyType(self._config.get("frontend", {}))
     
     @property
-    def database(self) -> Dict[str, Any]:
+    def database(self) -> Mapping[str, Any]:
         """获取数据库配置"""
-        return self._config.get("database", {})
+        return MappingProxyType(self._config.get("database", {}))
     
     @property
-    def logging(self) -> Dict[str, Any]:
+    def logging(self) -> Mapping[str, Any]:
         """获取日志配置"""
-        return self._config.get("logging", {})
+        return MappingProxyType(self._config.get("logging", {}))
     
     @property
-    def monitoring(self) -> Dict[str, Any]:
+    def monitoring(self) -> Mapping[str, Any]:
         """获取监控配置"""
-        return self._config.get("monitoring", {})
+        return MappingProxyType(self._config.get("monitoring", {}))
     
     def get_backend_url(self) -> str:
         """获取后端服务URL"""
-        backend = self.backend
-        return f"http://{backend.get('host', '127.0.0.1')}:{backend.get('port', 5318)}"
+        url = self._url_cache.get("backend")
+        if url is None:
+            backend = self.backend
+            url = self._url_cache["backend"] = f"http://{backend.get('host', '127.0.0.1')}:{backend.get('port', 5318)}"
+        return url
     
     def get_frontend_url(self) -> str:
         """获取前端服务URL"""
-        frontend = self.frontend
-        return f"http://localhost:{frontend.get('port', 5173)}"
+        url = self._url_cache.get("frontend")
+        if url is None:
+            url = self._url_cache["frontend"] = f"http://localhost:{self.frontend.get('port', 5173)}"
+        return url
 
 
-# 全局配置实例
-_config_manager: Optional[ConfigManager] = None
+# 全局配置实例，模块导入时创建(导入锁保证只创建一次，多线程访问无需再加锁)
+_config_manager = ConfigManager()
 
 
 def get_config() -> ConfigManager:
     """获取全局配置管理器"""
-    global _config_manager
-    if _config_manager is None:
-        _config_manager = ConfigManager()
     return _config_manager
 
 
@@ -7,7 +7,6 @@
 import subprocess
 import sys
 import time
-import os
 from pathlib import Path
 
 # 导入统一端口配置
@@ -26,7 +25,6 @@ def start_backend():
     print("🚀 启动后端服务...")
     
     backend_dir = Path(__file__).parent / "backend"
-    os.chdir(backend_dir)
     
     try:
         # 启动FastAPI服务
@@ -38,7 +36,8 @@ def start_backend():
         ]
         
         print(f"执行命令: {' '.join(cmd)}")
-        process = subprocess.Popen(cmd)
+        # 通过cwd指定子进程工作目录，不改变当前进程的工作目录
+        process = subprocess.Popen(cmd, cwd=str(backend_dir))
         print(f"✅ 后端服务已启动 (PID: {process.pid})")
         print(f"📍 服务地址: {BACKEND_URL}")
         print(f"📍 API文档: {BACKEND_URL}/docs")
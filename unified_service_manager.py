@@ -3,19 +3,18 @@
 管理所有相关服务：前端、后端、Electron等
 """
 
-import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox
-import threading
 import time
 import subprocess
-import requests
+import threading
 import json
-import webbrowser
-from datetime import datetime
-import psutil
+import socket
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import os
 import sys
 from pathlib import Path
+from urllib.parse import urlsplit
 
 # 导入统一端口配置
 try:
@@ -31,9 +30,74 @@ try:
 except ImportError:
     SHARED_CONFIG_AVAILABLE = False
 
+try:
+    import orjson  # 可选依赖，解析和格式化都在C中完成
+except ImportError:
+    orjson = None
+
+# 格式化API响应用的JSON编码器，复用同一个实例
+_JSON_DISPLAY_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+# 图形界面模块，命令行模式用不到，创建界面时由_import_tk导入
+tk = ttk = scrolledtext = messagebox = None
+
+
+def _import_tk():
+    """导入tkinter相关模块到模块全局，命令行模式下不导入以加快启动"""
+    global tk, ttk, scrolledtext, messagebox
+    import tkinter as tk
+    from tkinter import ttk, scrolledtext, messagebox
+
+
+def _format_json(body):
+    """将JSON响应体格式化为缩进文本，不是合法JSON时抛出ValueError"""
+    if orjson:
+        return orjson.dumps(orjson.loads(body), option=orjson.OPT_INDENT_2).decode('utf-8')
+    return _JSON_DISPLAY_ENCODER.encode(json.loads(body))
+
+
+def _terminate_process(proc, timeout=2):
+    """结束进程：先terminate，进程退出后立即返回；超时仍未退出则kill"""
+    import psutil
+    proc.terminate()
+    try:
+        proc.wait(timeout=timeout)
+    except psutil.TimeoutExpired:
+        proc.kill()
+        proc.wait(timeout=1)
+
 
 class UnifiedServiceManager:
+    # API日志保留的行数；超过阈值时一次性删除最旧的行
+    _API_LOG_MAX_LINES = 1000
+    _API_LOG_TRIM_THRESHOLD = 1200
+    
+    # API响应超过该字节数时不再解析格式化，只显示开头部分
+    _API_RESPONSE_MAX_BYTES = 64 * 1024
+    _API_RESPONSE_PREVIEW_CHARS = 4096
+    # 格式化后的响应最多显示的行数，避免一次写入就把之前的日志全部挤出
+    _API_RESPONSE_MAX_LINES = 500
+    # API测试的(连接, 读取)超时(秒)
+    _API_TEST_TIMEOUT = (0.25, 5)
+    
+    # 服务状态检查间隔(秒)：状态不变时逐步加倍，状态变化或启停操作后恢复最短间隔
+    _MONITOR_INTERVAL_MIN = 3
+    _MONITOR_INTERVAL_MAX = 30
+    
+    # 健康检查的(连接, 读取)超时(秒)：本地服务连接应立即建立，不响应时尽快判定
+    _HEALTH_TIMEOUT = (0.25, 1.0)
+    # 服务已在运行时，每隔几轮才做一次完整的HTTP检查，其余轮次只确认端口可以连接
+    _HTTP_PROBE_EVERY = 5
+    
+    # 后端操作：命令行管理器方法名前缀 -> 日志中的中文名称
+    _BACKEND_ACTIONS = {"start": "启动", "stop": "停止", "restart": "重启"}
+    
+    # 后端日志页的提示文本(日志功能尚未实现)
+    _BACKEND_LOG_NOTICE = ("📋 日志功能将在未来版本中完善\n"
+                           "提示: 可以通过命令行 'python unified_service_manager.py logs' 查看日志\n")
+    
     def __init__(self):
+        _import_tk()
         self.root = tk.Tk()
         self.root.title("量化回测系统 - 统一服务管理器")
         self.root.geometry("1000x700")
@@ -41,7 +105,31 @@ class UnifiedServiceManager:
         # 初始化配置
         self.load_shared_config()
         
+        # 后端启停共用的命令行管理器，项目目录按脚本位置确定一次，不依赖当前工作目录
+        self._cli = CLIServiceManager()
+        self._backend_action_lock = threading.Lock()  # 后端启停操作串行执行
+        
+        # 健康检查和API测试共用一个会话，首次使用时创建(requests延迟导入，加快窗口显示)
+        self._http = None
+        self._http_lock = threading.Lock()
+        # 状态检查线程池：一个线程执行一轮检查(含后端检查)，另一个并行检查前端
+        self._probe_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="usm-probe")
+        # 按钮操作(启停服务、API测试等)共用的线程池，避免每次点击新建线程
+        self._action_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="usm-action")
+        
         self.monitoring = False
+        self._monitor_job = None  # 等待中的下一轮检查定时器
+        self._monitor_busy = False  # 一轮检查正在线程池中执行
+        self._monitor_rerun = False  # 检查进行中又收到立即检查的请求
+        self._monitor_interval = self._MONITOR_INTERVAL_MIN
+        self._monitor_last_status = None
+        self._probe_round = 0  # 已执行的检查轮数，只在检查线程中读写
+        self._last_button_state = None  # 最近一次按钮状态对应的(后端, 前端)服务状态
+        self._api_log_lines = 0  # API日志中的行数，避免每次向Tk查询
+        self._log_queue = deque()  # 待写入API日志的条目
+        self._log_flush_pending = False  # 是否已安排写入
+        self._context_menu = None  # 文本组件共用的右键菜单
+        self._context_menu_target = None  # 右键菜单当前操作的文本组件
         self.setup_ui()
         self.start_monitoring()
         
@@ -71,6 +159,14 @@ class UnifiedServiceManager:
             except Exception as e:
                 print(f"警告：无法加载共享配置，使用默认值: {e}")
         
+        # 各服务状态对应的标签文本和颜色，端口确定后只生成一次
+        self._status_texts = {
+            ("backend", "running"): (f"🟢 运行中 ({backend_port})", "green"),
+            ("backend", "stopped"): ("🔴 已停止", "red"),
+            ("frontend", "running"): (f"🟢 运行中 ({frontend_port})", "green"),
+            ("frontend", "stopped"): ("🔴 已停止", "red"),
+        }
+        
         # 服务配置
         self.services = {
             "backend": {
@@ -92,6 +188,11 @@ class UnifiedServiceManager:
                 "process_name": "npm"
             }
         }
+        # 健康检查地址和端口连通检查用的(主机, 端口)只计算一次
+        for service in self.services.values():
+            service["health_url"] = service["url"] + service["health_endpoint"]
+            parts = urlsplit(service["url"])
+            service["address"] = (parts.hostname, parts.port or service["port"])
         
     def setup_ui(self):
         """设置用户界面"""
@@ -141,15 +242,15 @@ class UnifiedServiceManager:
         backend_btn_frame.grid(row=0, column=2, padx=(20, 0))
         
         self.backend_start_btn = ttk.Button(backend_btn_frame, text="启动", 
-                                          command=lambda: self.start_backend())
+                                          command=self.start_backend)
         self.backend_start_btn.pack(side=tk.LEFT, padx=2)
         
         self.backend_stop_btn = ttk.Button(backend_btn_frame, text="停止",
-                                         command=lambda: self.stop_backend())
+                                         command=self.stop_backend)
         self.backend_stop_btn.pack(side=tk.LEFT, padx=2)
         
         self.backend_restart_btn = ttk.Button(backend_btn_frame, text="重启",
-                                            command=lambda: self.restart_backend())
+                                            command=self.restart_backend)
         self.backend_restart_btn.pack(side=tk.LEFT, padx=2)
         
         # 前端服务
@@ -163,11 +264,11 @@ class UnifiedServiceManager:
         frontend_btn_frame.grid(row=1, column=2, padx=(20, 0))
         
         self.frontend_start_btn = ttk.Button(frontend_btn_frame, text="启动",
-                                           command=lambda: self.start_frontend())
+                                           command=self.start_frontend)
         self.frontend_start_btn.pack(side=tk.LEFT, padx=2)
         
         self.frontend_stop_btn = ttk.Button(frontend_btn_frame, text="停止",
-                                          command=lambda: self.stop_frontend())
+                                          command=self.stop_frontend)
         self.frontend_stop_btn.pack(side=tk.LEFT, padx=2)
         
         # 端口信息
@@ -183,15 +284,15 @@ class UnifiedServiceManager:
         
         # 前端链接
         ttk.Button(links_frame, text="🌐 打开前端应用", 
-                  command=lambda: self.open_url(self.services["frontend"]["url"])).pack(fill=tk.X, pady=2)
+                  command=partial(self.open_url, self.services["frontend"]["url"])).pack(fill=tk.X, pady=2)
         
         # API文档链接
         ttk.Button(links_frame, text="📚 API文档", 
-                  command=lambda: self.open_url(f"{self.services['backend']['url']}/docs")).pack(fill=tk.X, pady=2)
+                  command=partial(self.open_url, f"{self.services['backend']['url']}/docs")).pack(fill=tk.X, pady=2)
         
         # 健康检查
         ttk.Button(links_frame, text="💚 后端健康检查", 
-                  command=lambda: self.open_url(f"{self.services['backend']['url']}/healthz")).pack(fill=tk.X, pady=2)
+                  command=partial(self.open_url, self.services["backend"]["health_url"])).pack(fill=tk.X, pady=2)
         
         ttk.Separator(links_frame, orient='horizontal').pack(fill=tk.X, pady=10)
         
@@ -202,15 +303,15 @@ class UnifiedServiceManager:
         api_frame.pack(fill=tk.X, pady=2)
         
         ttk.Button(api_frame, text="数据状态", width=12,
-                  command=lambda: self.test_api("/data/status")).pack(side=tk.LEFT, padx=2)
+                  command=partial(self.test_api, "/data/status")).pack(side=tk.LEFT, padx=2)
         ttk.Button(api_frame, text="标签列表", width=12,
-                  command=lambda: self.test_api("/labels/list")).pack(side=tk.LEFT, padx=2)
+                  command=partial(self.test_api, "/labels/list")).pack(side=tk.LEFT, padx=2)
         
         api_frame2 = ttk.Frame(links_frame)
         api_frame2.pack(fill=tk.X, pady=2)
         
         ttk.Button(api_frame2, text="策略列表", width=12,
-                  command=lambda: self.test_api("/backtest/strategies")).pack(side=tk.LEFT, padx=2)
+                  command=partial(self.test_api, "/backtest/strategies")).pack(side=tk.LEFT, padx=2)
         ttk.Button(api_frame2, text="清空日志", width=12,
                   command=self.clear_log).pack(side=tk.LEFT, padx=2)
         
@@ -251,62 +352,147 @@ class UnifiedServiceManager:
         
         ttk.Button(log_control_frame, text="刷新后端日志", command=self.refresh_backend_log).pack(side=tk.LEFT, padx=5)
         ttk.Button(log_control_frame, text="清空显示", command=self.clear_backend_log).pack(side=tk.LEFT, padx=5)
-        ttk.Button(log_control_frame, text="复制选中", command=lambda: self._copy_selected_text(self.backend_log)).pack(side=tk.LEFT, padx=5)
-        ttk.Button(log_control_frame, text="复制全部", command=lambda: self._copy_all_text(self.backend_log)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(log_control_frame, text="复制选中", command=partial(self._copy_selected_text, self.backend_log)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(log_control_frame, text="复制全部", command=partial(self._copy_all_text, self.backend_log)).pack(side=tk.LEFT, padx=5)
         
     def start_monitoring(self):
-        """启动监控线程"""
+        """启动状态监控：由Tk定时器驱动，检查在线程池中执行，结果回到界面线程更新"""
         self.monitoring = True
-        monitor_thread = threading.Thread(target=self.monitor_services, daemon=True)
-        monitor_thread.start()
-        
-    def monitor_services(self):
-        """监控所有服务状态"""
-        while self.monitoring:
-            self.check_all_services()
-            time.sleep(3)  # 每3秒检查一次
+        self._monitor_tick()
+        
+    def _monitor_tick(self):
+        """定时器回调：提交一轮状态检查，上一轮未结束时不重复提交"""
+        self._monitor_job = None
+        if not self.monitoring:
+            return
+        if self._monitor_busy:
+            self._monitor_rerun = True
+            return
+        self._monitor_busy = True
+        self._probe_pool.submit(self.check_all_services)
+        
+    def _wake_monitor(self):
+        """启停操作完成后立即检查一次状态(可在任意线程调用)"""
+        self.root.after(0, self._monitor_now)
+        
+    def _monitor_now(self):
+        """取消等待中的定时器，马上开始下一轮检查"""
+        self._monitor_interval = self._MONITOR_INTERVAL_MIN
+        if self._monitor_job is not None:
+            self.root.after_cancel(self._monitor_job)
+        self._monitor_tick()
             
     def check_all_services(self):
-        """检查所有服务状态"""
-        # 检查后端服务
-        self.check_backend_status()
-        # 检查前端服务
-        self.check_frontend_status()
+        """检查所有服务状态(在线程池中执行)"""
+        backend = frontend = "stopped"
+        try:
+            # 顺带回收由本界面启动且已退出的后端子进程
+            self._cli.poll_backend()
+            # 两个检查互不依赖，并行执行，一个服务无响应时不拖慢另一个
+            self._probe_round += 1
+            deep = self._probe_round % self._HTTP_PROBE_EVERY == 0
+            frontend_check = self._probe_pool.submit(self._probe_service, "frontend", self.check_frontend_status, deep)
+            backend = self._probe_service("backend", self.check_backend_status, deep)
+            frontend = frontend_check.result()
+        except Exception as e:
+            self.log_message(f"❌ 检查服务状态时出错: {e}")
+        finally:
+            # 出错时也交回界面线程，清除进行中标志并安排下一轮检查，避免监控就此停止
+            self.root.after(0, self._on_services_checked, backend, frontend)
+        
+    def _on_services_checked(self, backend, frontend):
+        """在界面线程中更新状态显示，并按状态是否变化安排下一轮检查"""
+        self._monitor_busy = False
+        if not self.monitoring:
+            return
+        
+        # 状态未变化时不重复设置标签
+        for name, status, label in (("backend", backend, self.backend_status),
+                                    ("frontend", frontend, self.frontend_status)):
+            if self.services[name]["status"] != status:
+                self.services[name]["status"] = status
+                text, color = self._status_texts[name, status]
+                label.config(text=text, foreground=color)
+        
         # 更新按钮状态
         self.update_button_states()
         
+        # 状态不变时逐步放宽检查间隔
+        status = (backend, frontend)
+        if status != self._monitor_last_status:
+            self._monitor_last_status = status
+            self._monitor_interval = self._MONITOR_INTERVAL_MIN
+        else:
+            self._monitor_interval = min(self._monitor_interval * 2, self._MONITOR_INTERVAL_MAX)
+        
+        delay = 0 if self._monitor_rerun else self._monitor_interval
+        self._monitor_rerun = False
+        self._monitor_job = self.root.after(delay * 1000, self._monitor_tick)
+        
+    def _session(self):
+        """获取共用的HTTP会话，复用keep-alive连接；本地服务不需要自动重试"""
+        if self._http is None:
+            with self._http_lock:
+                if self._http is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+                    # 服务地址配置为https时同样复用连接且不重试
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    self._http = session
+        return self._http
+        
+    def _probe_service(self, name, http_check, deep):
+        """先检查端口能否连接；服务此前未运行或需要完整检查时，再发HTTP请求确认"""
+        service = self.services[name]
+        if not self._tcp_alive(service["address"], self._HEALTH_TIMEOUT[0]):
+            return "stopped"
+        if deep or service["status"] != "running":
+            return http_check()
+        return "running"
+        
+    @staticmethod
+    def _tcp_alive(address, timeout):
+        """端口是否可以建立TCP连接"""
+        try:
+            with socket.create_connection(address, timeout=timeout):
+                return True
+        except OSError:
+            return False
+            
     def check_backend_status(self):
-        """检查后端服务状态"""
+        """检查后端服务状态，返回 running 或 stopped"""
         try:
-            health_url = f"{self.services['backend']['url']}/healthz"
-            response = requests.get(health_url, timeout=2)
-            if response.status_code == 200:
-                self.services["backend"]["status"] = "running"
-                port = self.services['backend']['port']
-                self.backend_status.config(text=f"🟢 运行中 ({port})", foreground="green")
-            else:
-                raise requests.RequestException("非200响应")
-        except:
-            self.services["backend"]["status"] = "stopped"
-            self.backend_status.config(text="🔴 已停止", foreground="red")
+            response = self._session().get(self.services["backend"]["health_url"], timeout=self._HEALTH_TIMEOUT)
+            return "running" if response.status_code == 200 else "stopped"
+        except Exception:
+            return "stopped"
             
     def check_frontend_status(self):
-        """检查前端服务状态"""
+        """检查前端服务状态，返回 running 或 stopped"""
         try:
-            response = requests.get(self.services["frontend"]["url"], timeout=2)
-            # Vite开发服务器通常返回HTML页面
-            if response.status_code == 200:
-                self.services["frontend"]["status"] = "running"
-                port = self.services['frontend']['port']
-                self.frontend_status.config(text=f"🟢 运行中 ({port})", foreground="green")
-            else:
-                raise requests.RequestException("非200响应")
-        except:
-            self.services["frontend"]["status"] = "stopped"
-            self.frontend_status.config(text="🔴 已停止", foreground="red")
+            url = self.services["frontend"]["health_url"]
+            http = self._session()
+            # 只需确认服务存活，用HEAD避免每次传输整个页面
+            response = http.head(url, timeout=self._HEALTH_TIMEOUT, allow_redirects=False)
+            if response.status_code == 405:
+                # 不支持HEAD时改用GET，只读响应头，不读取页面内容
+                with http.get(url, timeout=self._HEALTH_TIMEOUT, stream=True) as response:
+                    pass
+            # 开发服务器对HEAD的处理不尽相同(如重定向、404)，能正常应答即视为运行中
+            return "running" if response.status_code < 500 else "stopped"
+        except Exception:
+            return "stopped"
             
     def update_button_states(self):
-        """更新按钮状态"""
+        """更新按钮状态，服务状态与上次相同时不做任何修改"""
+        button_state = (self.services["backend"]["status"], self.services["frontend"]["status"])
+        if button_state == self._last_button_state:
+            return
+        self._last_button_state = button_state
+        
         # 后端按钮
         if self.services["backend"]["status"] == "running":
             self.backend_start_btn.config(state="disabled")
@@ -325,68 +511,49 @@ class UnifiedServiceManager:
             self.frontend_start_btn.config(state="normal")
             self.frontend_stop_btn.config(state="disabled")
             
-    def start_backend(self):
-        """启动后端服务"""
-        self.log_message("正在启动后端服务...")
-        
-        def run_start():
+    def _run_backend_action(self, action):
+        """在当前进程中执行命令行管理器的后端操作，省去启动新解释器；返回(是否成功, 输出文本)
+
+        输出通过out参数逐行收集，不替换全局的sys.stdout；后端操作逐个执行，
+        避免重叠的启停操作同时读写PID文件。
+        """
+        lines = []
+        with self._backend_action_lock:
+            ok = action(self._cli, out=lines.append)
+        return ok, "\n".join(lines).strip()
+        
+    def _backend_action(self, verb):
+        """在线程池中执行后端的启动/停止/重启操作，完成后记录结果并立即刷新状态"""
+        verb_cn = self._BACKEND_ACTIONS[verb]
+        self.log_message(f"正在{verb_cn}后端服务...")
+        action = getattr(CLIServiceManager, f"{verb}_backend")
+        
+        def run_action():
             try:
-                result = subprocess.run(
-                    [sys.executable, "unified_service_manager.py", "start"],
-                    capture_output=True, text=True, cwd=Path.cwd()
-                )
-                
-                if result.returncode == 0:
-                    self.log_message("✅ 后端服务启动成功")
+                ok, output = self._run_backend_action(action)
+                if ok:
+                    self.log_message(f"✅ 后端服务{verb_cn}成功")
                 else:
-                    self.log_message(f"❌ 后端服务启动失败: {result.stderr}")
+                    self.log_message(f"❌ 后端服务{verb_cn}失败: {output}")
                     
             except Exception as e:
-                self.log_message(f"❌ 启动后端服务时出错: {e}")
+                self.log_message(f"❌ {verb_cn}后端服务时出错: {e}")
+            finally:
+                self._wake_monitor()
                 
-        threading.Thread(target=run_start, daemon=True).start()
+        self._action_pool.submit(run_action)
+        
+    def start_backend(self):
+        """启动后端服务"""
+        self._backend_action("start")
         
     def stop_backend(self):
         """停止后端服务"""
-        self.log_message("正在停止后端服务...")
-        
-        def run_stop():
-            try:
-                result = subprocess.run(
-                    [sys.executable, "unified_service_manager.py", "stop"],
-                    capture_output=True, text=True, cwd=Path.cwd()
-                )
-                
-                if result.returncode == 0:
-                    self.log_message("✅ 后端服务停止成功")
-                else:
-                    self.log_message(f"❌ 后端服务停止失败: {result.stderr}")
-                    
-            except Exception as e:
-                self.log_message(f"❌ 停止后端服务时出错: {e}")
-                
-        threading.Thread(target=run_stop, daemon=True).start()
+        self._backend_action("stop")
         
     def restart_backend(self):
         """重启后端服务"""
-        self.log_message("正在重启后端服务...")
-        
-        def run_restart():
-            try:
-                result = subprocess.run(
-                    [sys.executable, "unified_service_manager.py", "restart"],
-                    capture_output=True, text=True, cwd=Path.cwd()
-                )
-                
-                if result.returncode == 0:
-                    self.log_message("✅ 后端服务重启成功")
-                else:
-                    self.log_message(f"❌ 后端服务重启失败: {result.stderr}")
-                    
-            except Exception as e:
-                self.log_message(f"❌ 重启后端服务时出错: {e}")
-                
-        threading.Thread(target=run_restart, daemon=True).start()
+        self._backend_action("restart")
         
     def start_frontend(self):
         """启动前端服务"""
@@ -397,7 +564,7 @@ class UnifiedServiceManager:
                 # 启动前端开发服务器
                 process = subprocess.Popen(
                     ["npm", "run", "dev"],
-                    cwd=Path.cwd() / "frontend",
+                    cwd=self._cli.project_root / "frontend",
                     creationflags=subprocess.CREATE_NEW_CONSOLE if os.name == 'nt' else 0
                 )
                 
@@ -410,8 +577,10 @@ class UnifiedServiceManager:
                 
             except Exception as e:
                 self.log_message(f"❌ 启动前端服务时出错: {e}")
+            finally:
+                self._wake_monitor()
                 
-        threading.Thread(target=run_start, daemon=True).start()
+        self._action_pool.submit(run_start)
         
     def stop_frontend(self):
         """停止前端服务"""
@@ -419,33 +588,53 @@ class UnifiedServiceManager:
         
         def run_stop():
             try:
+                # psutil只在停止前端时用到，首次调用时再导入；导入失败同样记录错误并刷新状态
+                import psutil
+                
                 # 优先使用保存的PID
                 frontend_pid = self.services["frontend"].get("pid")
                 if frontend_pid:
                     try:
                         proc = psutil.Process(frontend_pid)
                         if proc.is_running():
-                            proc.terminate()
+                            _terminate_process(proc)
                             self.log_message(f"✅ 停止前端进程 PID: {frontend_pid}")
                             self.services["frontend"]["pid"] = None
                             return
                     except psutil.NoSuchProcess:
                         self.log_message("⚠️ 保存的前端PID已不存在，尝试查找进程")
                 
-                # 如果PID方式失败，回退到进程查找
+                # 如果PID方式失败，先按监听端口直接找到进程
                 stopped = False
-                frontend_port = str(self.services['frontend']['port'])
-                for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-                    try:
-                        cmdline = proc.info.get('cmdline', [])
-                        if cmdline and any('vite' in str(cmd).lower() for cmd in cmdline):
-                            if any(frontend_port in str(cmd) for cmd in cmdline):
-                                proc.terminate()
+                frontend_port = int(self.services['frontend']['port'])
+                try:
+                    for conn in psutil.net_connections(kind='tcp'):
+                        if (conn.pid and conn.status == psutil.CONN_LISTEN
+                                and conn.laddr and conn.laddr.port == frontend_port):
+                            _terminate_process(psutil.Process(conn.pid))
+                            self.log_message(f"✅ 停止前端进程 PID: {conn.pid}")
+                            stopped = True
+                            break
+                except (psutil.AccessDenied, psutil.NoSuchProcess):
+                    pass
+                
+                # 无权限查询连接或端口未监听时，回退到按命令行查找进程
+                if not stopped:
+                    frontend_port = str(frontend_port)
+                    for proc in psutil.process_iter(['pid', 'cmdline']):
+                        try:
+                            cmdline = proc.info.get('cmdline')
+                            if not cmdline:
+                                continue
+                            # 命令行拼接后只转换一次小写，一遍检查两个关键字
+                            joined = ' '.join(cmdline).lower()
+                            if 'vite' in joined and frontend_port in joined:
+                                _terminate_process(proc)
                                 self.log_message(f"✅ 停止前端进程 PID: {proc.info['pid']}")
                                 stopped = True
                                 break
-                    except:
-                        continue
+                        except:
+                            continue
                 
                 if not stopped:
                     self.log_message("⚠️ 未找到前端进程")
@@ -455,16 +644,23 @@ class UnifiedServiceManager:
                 
             except Exception as e:
                 self.log_message(f"❌ 停止前端服务时出错: {e}")
+            finally:
+                self._wake_monitor()
                 
-        threading.Thread(target=run_stop, daemon=True).start()
+        self._action_pool.submit(run_stop)
         
     def open_url(self, url):
-        """打开URL"""
-        try:
-            webbrowser.open(url)
-            self.log_message(f"🌐 已打开链接: {url}")
-        except Exception as e:
-            self.log_message(f"❌ 打开链接失败: {e}")
+        """打开URL(在后台线程中启动浏览器，避免阻塞界面)"""
+        def run_open():
+            try:
+                # webbrowser只在打开链接时用到，首次调用时再导入
+                import webbrowser
+                webbrowser.open(url)
+                self.log_message(f"🌐 已打开链接: {url}")
+            except Exception as e:
+                self.log_message(f"❌ 打开链接失败: {e}")
+                
+        self._action_pool.submit(run_open)
             
     def test_api(self, endpoint):
         """测试API端点"""
@@ -473,44 +669,50 @@ class UnifiedServiceManager:
         def run_test():
             try:
                 url = f"{self.services['backend']['url']}{endpoint}"
-                response = requests.get(url, timeout=5)
+                # 流式读取，最多读到上限多一个字节，超出部分不下载
+                with self._session().get(url, timeout=self._API_TEST_TIMEOUT, stream=True) as response:
+                    if response.status_code != 200:
+                        self.log_message(f"❌ API测试失败 {endpoint}: HTTP {response.status_code}")
+                        return
+                    body = response.raw.read(self._API_RESPONSE_MAX_BYTES + 1, decode_content=True)
                 
-                if response.status_code == 200:
-                    try:
-                        data = response.json()
-                        formatted = json.dumps(data, indent=2, ensure_ascii=False)
-                        self.log_message(f"✅ API测试成功 {endpoint}:")
-                        self.log_message(formatted)
-                    except json.JSONDecodeError:
-                        self.log_message(f"✅ API响应 {endpoint}: {response.text[:200]}...")
-                else:
-                    self.log_message(f"❌ API测试失败 {endpoint}: HTTP {response.status_code}")
+                if len(body) > self._API_RESPONSE_MAX_BYTES:
+                    # 响应过大：跳过解析和重新格式化，避免大段文本拖慢界面
+                    preview = body[:self._API_RESPONSE_PREVIEW_CHARS * 4].decode('utf-8', errors='replace')
+                    self.log_message(f"✅ API测试成功 {endpoint} (响应超过 {self._API_RESPONSE_MAX_BYTES // 1024}KB，仅显示开头):",
+                                     f"{preview[:self._API_RESPONSE_PREVIEW_CHARS]}...<已截断>")
+                    return
+                try:
+                    formatted = _format_json(body)
+                    head = formatted.split("\n", self._API_RESPONSE_MAX_LINES)
+                    if len(head) > self._API_RESPONSE_MAX_LINES:
+                        formatted = "\n".join(head[:self._API_RESPONSE_MAX_LINES]) + "\n...<已截断>"
+                    self.log_message(f"✅ API测试成功 {endpoint}:", formatted)
+                except ValueError:
+                    self.log_message(f"✅ API响应 {endpoint}: {body[:800].decode('utf-8', errors='replace')[:200]}...")
                     
             except Exception as e:
                 self.log_message(f"❌ API测试出错 {endpoint}: {e}")
                 
-        threading.Thread(target=run_test, daemon=True).start()
+        self._action_pool.submit(run_test)
         
     def refresh_backend_log(self):
         """刷新后端日志"""
-        self.log_message("🔄 正在获取后端日志...")
-        
-        def run_refresh():
-            try:
-                # 简化的日志显示
-                self.backend_log.delete(1.0, tk.END)
-                self.backend_log.insert(tk.END, "📋 日志功能将在未来版本中完善\n")
-                self.backend_log.insert(tk.END, "提示: 可以通过命令行 'python unified_service_manager.py logs' 查看日志\n")
-                self.log_message("📋 日志显示已更新")
-                    
-            except Exception as e:
-                self.log_message(f"❌ 刷新后端日志时出错: {e}")
+        # 只修改文本组件，没有耗时操作，直接在界面线程中执行
+        try:
+            # 简化的日志显示：提示已在显示时不重复删除和写入
+            if self.backend_log.get("1.0", "end-1c") == self._BACKEND_LOG_NOTICE:
+                return
+            self.backend_log.delete(1.0, tk.END)
+            self.backend_log.insert(tk.END, self._BACKEND_LOG_NOTICE)
+            self.log_message("📋 日志显示已更新")
                 
-        threading.Thread(target=run_refresh, daemon=True).start()
+        except Exception as e:
+            self.log_message(f"❌ 刷新后端日志时出错: {e}")
         
     def clear_log(self):
         """清空API日志"""
-        self.api_log.delete(1.0, tk.END)
+        self._clear_text(self.api_log)
         self.log_message("🧹 API日志已清空")
         
     def clear_backend_log(self):
@@ -518,16 +720,43 @@ class UnifiedServiceManager:
         self.backend_log.delete(1.0, tk.END)
         self.log_message("🧹 后端日志显示已清空")
         
-    def log_message(self, message):
-        """记录消息到API日志"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+    def log_message(self, message, detail=None):
+        """记录消息到API日志，detail为附在消息后的多行内容(如API响应)，与消息一次写入
+
+        条目先进入队列，由界面线程合并后一次写入，可在任意线程中调用
+        """
+        timestamp = time.strftime("%H:%M:%S")
         log_entry = f"[{timestamp}] {message}\n"
-        
-        self.api_log.insert(tk.END, log_entry)
+        if detail:
+            log_entry += f"{detail}\n"
+        self._log_queue.append((log_entry, message))
+        
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            self.root.after(0, self._flush_log_queue)
+        
+    def _flush_log_queue(self):
+        """将队列中的日志合并为一次插入，裁剪、滚动和状态栏更新也只做一次"""
+        self._log_flush_pending = False
+        if not self._log_queue:
+            return
+        entries = []
+        while self._log_queue:
+            entries.append(self._log_queue.popleft())
+        log_text = "".join(entry for entry, _ in entries)
+        
+        self.api_log.insert(tk.END, log_text)
+        self._api_log_lines += log_text.count("\n")
+        
+        # 限制日志行数，避免长时间运行后文本组件越来越慢
+        if self._api_log_lines > self._API_LOG_TRIM_THRESHOLD:
+            excess = self._api_log_lines - self._API_LOG_MAX_LINES
+            self.api_log.delete("1.0", f"{excess + 1}.0")
+            self._api_log_lines = self._API_LOG_MAX_LINES
         self.api_log.see(tk.END)
         
         # 更新状态栏
-        self.status_bar.config(text=f"最后操作: {message}")
+        self.status_bar.config(text=f"最后操作: {entries[-1][1]}")
         
     def run(self):
         """运行GUI"""
@@ -538,26 +767,47 @@ class UnifiedServiceManager:
     def on_closing(self):
         """关闭时清理"""
         self.monitoring = False
+        if self._monitor_job is not None:
+            self.root.after_cancel(self._monitor_job)
+        self._probe_pool.shutdown(wait=False)
+        self._action_pool.shutdown(wait=False, cancel_futures=True)
+        if self._http is not None:
+            self._http.close()
         self.root.destroy()
     
     def _setup_text_context_menu(self, text_widget):
-        """为文本组件设置右键菜单"""
-        context_menu = tk.Menu(self.root, tearoff=0)
-        context_menu.add_command(label="复制选中", command=lambda: self._copy_selected_text(text_widget))
-        context_menu.add_command(label="复制全部", command=lambda: self._copy_all_text(text_widget))
-        context_menu.add_command(label="全选", command=lambda: self._select_all_text(text_widget))
-        context_menu.add_separator()
-        context_menu.add_command(label="清空", command=lambda: text_widget.delete(1.0, tk.END))
-        
-        def show_context_menu(event):
-            try:
-                context_menu.tk_popup(event.x_root, event.y_root)
-            except Exception:
-                pass
-            finally:
-                context_menu.grab_release()
-        
-        text_widget.bind("<Button-3>", show_context_menu)  # 右键点击
+        """为文本组件设置右键菜单，所有文本组件共用一个菜单，操作对象为右键点击的组件"""
+        if self._context_menu is None:
+            menu = tk.Menu(self.root, tearoff=0)
+            menu.add_command(label="复制选中", command=partial(self._on_context_menu, self._copy_selected_text))
+            menu.add_command(label="复制全部", command=partial(self._on_context_menu, self._copy_all_text))
+            menu.add_command(label="全选", command=partial(self._on_context_menu, self._select_all_text))
+            menu.add_separator()
+            menu.add_command(label="清空", command=partial(self._on_context_menu, self._clear_text))
+            self._context_menu = menu
+        
+        text_widget.bind("<Button-3>", self._show_context_menu)  # 右键点击
+    
+    def _show_context_menu(self, event):
+        """在鼠标位置弹出右键菜单，并记录被点击的文本组件"""
+        self._context_menu_target = event.widget
+        try:
+            self._context_menu.tk_popup(event.x_root, event.y_root)
+        except Exception:
+            pass
+        finally:
+            self._context_menu.grab_release()
+    
+    def _on_context_menu(self, action):
+        """对最近一次右键点击的文本组件执行菜单操作"""
+        if self._context_menu_target is not None:
+            action(self._context_menu_target)
+    
+    def _clear_text(self, text_widget):
+        """清空文本组件，API日志同时重置行数计数，保证后续裁剪位置正确"""
+        text_widget.delete(1.0, tk.END)
+        if text_widget is self.api_log:
+            self._api_log_lines = 0
     
     def _copy_selected_text(self, text_widget):
         """复制选中的文本到剪贴板"""
@@ -596,6 +846,129 @@ class UnifiedServiceManager:
             self.log_message(f"❌ 全选失败: {e}")
 
 
+class CLIServiceManager:
+    """简化的服务管理器，供命令行和图形界面的后端启停操作使用
+
+    启停方法的out参数接收每行输出，默认打印到控制台；图形界面传入自己的收集函数。
+    """
+    
+    def __init__(self):
+        self.project_root = Path(__file__).parent
+        self.backend_dir = self.project_root / "backend"
+        self.pid_file = self.project_root / ".service.pid"
+        self._pid_data = {}  # PID文件内容缓存
+        self._pid_mtime = None  # 缓存对应的PID文件修改时间
+        # 本进程启动的后端子进程；图形界面中进程退出后需由本进程回收，否则成为僵尸进程
+        self._backend_process = None
+        
+    def poll_backend(self):
+        """回收本进程启动且已退出的后端子进程"""
+        process = self._backend_process
+        if process is not None and process.poll() is not None:
+            self._backend_process = None
+        
+    def _read_pid_data(self):
+        """读取PID文件，文件未修改时直接返回缓存的内容"""
+        try:
+            mtime = self.pid_file.stat().st_mtime_ns
+        except OSError:
+            return {}
+        if mtime != self._pid_mtime:
+            try:
+                with open(self.pid_file, 'r') as f:
+                    self._pid_data = json.load(f)
+            except (OSError, ValueError):
+                self._pid_data = {}
+            self._pid_mtime = mtime
+        return self._pid_data
+        
+    def get_service_pid(self, service_name):
+        """获取服务PID"""
+        return self._read_pid_data().get(service_name)
+            
+    def is_process_running(self, pid):
+        """检查进程是否运行"""
+        # 本进程启动的后端直接查询子进程句柄，同时回收已退出的进程
+        process = self._backend_process
+        if process is not None and process.pid == pid:
+            return process.poll() is None
+        import psutil
+        try:
+            # 僵尸进程已退出，只是尚未被父进程回收，不算运行中
+            return psutil.Process(pid).status() != psutil.STATUS_ZOMBIE
+        except (psutil.Error, ValueError, OverflowError):
+            return False
+            
+    def start_backend(self, out=print):
+        """启动后端服务"""
+        out("🚀 启动后端服务...")
+        try:
+            cmd = [sys.executable, str(self.backend_dir / "app" / "main.py"), "--port", "5318"]
+            process = subprocess.Popen(cmd, cwd=str(self.project_root))
+            self._backend_process = process
+            
+            # 保存PID
+            pid_data = dict(self._read_pid_data())
+            pid_data['backend'] = process.pid
+            with open(self.pid_file, 'w') as f:
+                json.dump(pid_data, f)
+            # 直接更新缓存，不依赖修改时间的精度
+            self._pid_data = pid_data
+            self._pid_mtime = self.pid_file.stat().st_mtime_ns
+            
+            out(f"✅ 后端服务启动成功 (PID: {process.pid})")
+            out(f"📍 服务地址: http://127.0.0.1:5318")
+            return True
+        except Exception as e:
+            out(f"❌ 启动失败: {e}")
+            return False
+            
+    def stop_backend(self, out=print):
+        """停止后端服务"""
+        self.poll_backend()
+        pid = self.get_service_pid('backend')
+        if not pid:
+            out("⚠️ 后端服务未运行")
+            return True
+            
+        if not self.is_process_running(pid):
+            out("⚠️ 后端服务进程已停止")
+            return True
+            
+        import psutil
+        try:
+            _terminate_process(psutil.Process(pid))
+            self.poll_backend()
+            out("✅ 后端服务已停止")
+            return True
+        except Exception as e:
+            out(f"❌ 停止失败: {e}")
+            return False
+            
+    def restart_backend(self, out=print):
+        """重启后端服务"""
+        out("🔄 重启后端服务...")
+        self.stop_backend(out)
+        time.sleep(2)
+        return self.start_backend(out)
+            
+    def show_status(self):
+        """显示服务状态"""
+        print("📊 系统状态")
+        print("=" * 50)
+        
+        # 检查后端状态
+        self.poll_backend()
+        backend_pid = self.get_service_pid('backend')
+        if backend_pid and self.is_process_running(backend_pid):
+            print(f"✅ 后端服务: 运行中 (PID: {backend_pid})")
+            print(f"📍 服务地址: http://127.0.0.1:5318")
+        else:
+            print("❌ 后端服务: 已停止")
+            
+        print(f"🕐 检查时间: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+
+
 def run_command_line():
     """命令行模式运行"""
     import argparse
@@ -629,95 +1002,6 @@ def run_command_line():
         parser.print_help()
         return
     
-    # 创建一个简化的服务管理器用于命令行操作
-    class CLIServiceManager:
-        def __init__(self):
-            self.project_root = Path(__file__).parent
-            self.backend_dir = self.project_root / "backend"
-            self.pid_file = self.project_root / ".service.pid"
-            
-        def get_service_pid(self, service_name):
-            """获取服务PID"""
-            if not self.pid_file.exists():
-                return None
-            try:
-                with open(self.pid_file, 'r') as f:
-                    data = json.load(f)
-                return data.get(service_name)
-            except:
-                return None
-                
-        def is_process_running(self, pid):
-            """检查进程是否运行"""
-            try:
-                return psutil.pid_exists(pid) and psutil.Process(pid).is_running()
-            except:
-                return False
-                
-        def start_backend(self):
-            """启动后端服务"""
-            print("🚀 启动后端服务...")
-            try:
-                cmd = [sys.executable, str(self.backend_dir / "app" / "main.py"), "--port", "5318"]
-                process = subprocess.Popen(cmd, cwd=str(self.project_root))
-                
-                # 保存PID
-                pid_data = {}
-                if self.pid_file.exists():
-                    try:
-                        with open(self.pid_file, 'r') as f:
-                            pid_data = json.load(f)
-                    except:
-                        pass
-                
-                pid_data['backend'] = process.pid
-                with open(self.pid_file, 'w') as f:
-                    json.dump(pid_data, f)
-                
-                print(f"✅ 后端服务启动成功 (PID: {process.pid})")
-                print(f"📍 服务地址: http://127.0.0.1:5318")
-                return True
-            except Exception as e:
-                print(f"❌ 启动失败: {e}")
-                return False
-                
-        def stop_backend(self):
-            """停止后端服务"""
-            pid = self.get_service_pid('backend')
-            if not pid:
-                print("⚠️ 后端服务未运行")
-                return True
-                
-            if not self.is_process_running(pid):
-                print("⚠️ 后端服务进程已停止")
-                return True
-                
-            try:
-                psutil.Process(pid).terminate()
-                time.sleep(2)
-                if self.is_process_running(pid):
-                    psutil.Process(pid).kill()
-                print("✅ 后端服务已停止")
-                return True
-            except Exception as e:
-                print(f"❌ 停止失败: {e}")
-                return False
-                
-        def show_status(self):
-            """显示服务状态"""
-            print("📊 系统状态")
-            print("=" * 50)
-            
-            # 检查后端状态
-            backend_pid = self.get_service_pid('backend')
-            if backend_pid and self.is_process_running(backend_pid):
-                print(f"✅ 后端服务: 运行中 (PID: {backend_pid})")
-                print(f"📍 服务地址: http://127.0.0.1:5318")
-            else:
-                print("❌ 后端服务: 已停止")
-                
-            print(f"🕐 检查时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    
     manager = CLIServiceManager()
     
     try:
@@ -728,10 +1012,7 @@ def run_command_line():
         elif args.command == 'stop':
             manager.stop_backend()
         elif args.command == 'restart':
-            print("🔄 重启后端服务...")
-            manager.stop_backend()
-            time.sleep(2)
-            manager.start_backend()
+            manager.restart_backend()
         elif args.command == 'logs':
             print("📋 查看日志功能需要在GUI模式下使用")
         elif args.command == 'config':